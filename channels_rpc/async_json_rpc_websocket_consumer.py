@@ -9,8 +9,22 @@ from channels.generic.websocket import AsyncJsonWebsocketConsumer
 from channels_rpc.async_rpc_base import AsyncRpcBase
 from channels_rpc.exceptions import JsonRpcErrorCode, generate_error_response
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None  # type: ignore[assignment]
+
 logger = logging.getLogger("channels_rpc")
 
+if orjson is not None:
+    # Route datetimes and dataclasses through ``default=str`` so the output
+    # matches the stdlib encoder's str() fallback
+    _ORJSON_OPTIONS = (
+        orjson.OPT_NON_STR_KEYS
+        | orjson.OPT_PASSTHROUGH_DATACLASS
+        | orjson.OPT_PASSTHROUGH_DATETIME
+    )
+
 
 class AsyncJsonRpcWebsocketConsumer(AsyncJsonWebsocketConsumer, AsyncRpcBase):
     """Async WebSocket consumer for JSON-RPC 2.0 communication.
@@ -28,6 +42,10 @@ class AsyncJsonRpcWebsocketConsumer(AsyncJsonWebsocketConsumer, AsyncRpcBase):
         Optional custom JSON encoder class for serializing RPC responses.
         If provided, this encoder will be used for all response serialization.
         If None, uses default encoder with str() fallback.
+    use_orjson : bool
+        Whether to serialize responses with orjson when it is installed and
+        no json_encoder_class is set (default: False). Install the
+        ``orjson`` extra to enable it.
 
     Use Cases
     ---------
@@ -62,6 +80,7 @@ class AsyncJsonRpcWebsocketConsumer(AsyncJsonWebsocketConsumer, AsyncRpcBase):
     """
 
     json_encoder_class: type[json.JSONEncoder] | None = None
+    use_orjson: bool = False
 
     @classmethod
     async def encode_json(cls, data: dict[str, Any]) -> str:  # type: ignore[override]
@@ -81,6 +100,10 @@ class AsyncJsonRpcWebsocketConsumer(AsyncJsonWebsocketConsumer, AsyncRpcBase):
         -----
         If json_encoder_class is set, uses that encoder. Otherwise uses
         default encoder with str() fallback for non-serializable objects.
+        When use_orjson is enabled and orjson is installed, the default
+        encoding is done by orjson instead; payloads it rejects (e.g. integers
+        wider than 64 bits) fall back to the standard library encoder. Note
+        that orjson encodes plain Enum members by value and NaN as null.
 
         If serialization fails, attempts to send a proper error response.
         As a last resort, returns a hardcoded minimal error to prevent
@@ -105,6 +128,13 @@ class AsyncJsonRpcWebsocketConsumer(AsyncJsonWebsocketConsumer, AsyncRpcBase):
         try:
             if cls.json_encoder_class:
                 return json.dumps(data, cls=cls.json_encoder_class)
+            if cls.use_orjson and orjson is not None:
+                try:
+                    return orjson.dumps(
+                        data, default=str, option=_ORJSON_OPTIONS
+                    ).decode()
+                except orjson.JSONEncodeError:
+                    pass
             return json.dumps(data, default=str)
         except (TypeError, ValueError) as e:
             logger.error("Failed to serialize RPC response: %s", e)
@@ -21,7 +21,7 @@ from channels_rpc.signals import (
     rpc_method_failed,
     rpc_method_started,
 )
-from channels_rpc.utils import create_json_rpc_response
+from channels_rpc.utils import ID_KEY, JSONRPC_KEY, JSONRPC_VERSION, RESULT_KEY
 from channels_rpc.validation import validate_rpc_data
 
 logger = logging.getLogger("channels_rpc")
@@ -165,7 +165,10 @@ class AsyncRpcBase(RpcBase):
         else:
             timeout = method_timeout
 
-        logger.debug("Executing %s(%s)", method.__qualname__, json.dumps(params))
+        # Only pay for serializing the parameters when debug logging is on;
+        # notifications in particular never build anything else per call
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Executing %s(%s)", method.__qualname__, json.dumps(params))
 
         # Execute method with timeout enforcement
         if timeout is not None:
@@ -195,13 +198,9 @@ class AsyncRpcBase(RpcBase):
 
         if not is_notification:
             logger.debug("Execution result: %s", result)
-            # Return standard JSON-RPC 2.0 response
-            response = create_json_rpc_response(
-                rpc_id=rpc_id,
-                result=result,
-                compressed=False,
-            )
-            return response
+            # Standard JSON-RPC 2.0 response, built inline on this hot path
+            # (same envelope as create_json_rpc_response())
+            return {JSONRPC_KEY: JSONRPC_VERSION, ID_KEY: rpc_id, RESULT_KEY: result}
         elif result is not None:
             logger.warning("The notification method shouldn't return any result")
             logger.warning("method: %s, params: %s", method.__qualname__, params)
@@ -436,7 +435,9 @@ class AsyncRpcBase(RpcBase):
         rpc_id: str | int | float | None,
         method_name: str,
         start_time: float,
-    ) -> dict[str, Any]:
+        *,
+        is_notification: bool = False,
+    ) -> dict[str, Any] | None:
         """Handle exceptions during RPC method execution.
 
         Parameters
@@ -449,11 +450,14 @@ class AsyncRpcBase(RpcBase):
             Method name for error reporting.
         start_time : float
             Start time for duration calculation.
+        is_notification : bool, optional
+            Whether the call is a notification, by default False.
 
         Returns
         -------
-        dict[str, Any]
-            Error response.
+        dict[str, Any] | None
+            Error response, or None for notifications, which never receive
+            one.
         """
         duration = time.time() - start_time
         rpc_method_failed.send(
@@ -467,17 +471,13 @@ class AsyncRpcBase(RpcBase):
 
         if isinstance(exception, JsonRpcError):
             # Re-raise JSON-RPC errors as-is
-            return exception.as_dict()
+            return None if is_notification else exception.as_dict()
         elif isinstance(exception, ValueError | TypeError | KeyError | AttributeError):
             # Expected application-level errors (domain logic errors)
             # Note: RuntimeError intentionally NOT caught here - it indicates bugs
             logger.info("Application error in RPC method: %s", exception)
-            return generate_error_response(
-                rpc_id=rpc_id,
-                code=JsonRpcErrorCode.GENERIC_APPLICATION_ERROR,
-                message="Application error occurred",
-                data=None,  # Never leak internal details
-            )
+            code = JsonRpcErrorCode.GENERIC_APPLICATION_ERROR
+            message = "Application error occurred"
         else:
             # Unexpected errors - these indicate bugs
             # Check if we should sanitize errors (production mode)
@@ -496,12 +496,18 @@ class AsyncRpcBase(RpcBase):
                 # Development mode: Log with full stack trace for debugging
                 logger.exception("Unexpected error processing RPC call")
 
-            return generate_error_response(
-                rpc_id=rpc_id,
-                code=JsonRpcErrorCode.INTERNAL_ERROR,
-                message="Internal server error",
-                data=None,  # Never leak internal details
-            )
+            code = JsonRpcErrorCode.INTERNAL_ERROR
+            message = "Internal server error"
+
+        if is_notification:
+            # Nothing is sent back for notifications, so skip the envelope
+            return None
+        return generate_error_response(
+            rpc_id=rpc_id,
+            code=code,
+            message=message,
+            data=None,  # Never leak internal details
+        )
 
     async def _intercept_call(  # type: ignore[override]
         self, data: dict[str, Any] | list[dict[str, Any]] | None
@@ -650,7 +656,9 @@ class AsyncRpcBase(RpcBase):
             # Handle application-level errors only
             # Note: Exception removed from tuple to avoid masking system exceptions
             # Unexpected errors will propagate and be logged by outer error handlers
-            result = self._handle_rpc_exception(e, rpc_id, method_name, start_time)
+            result = self._handle_rpc_exception(
+                e, rpc_id, method_name, start_time, is_notification=is_notification
+            )
 
         if rpc_id:
             logger.debug(logs.RPC_METHOD_CALL_END, rpc_id, method_name, result)
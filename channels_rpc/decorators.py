@@ -10,7 +10,9 @@ import asyncio
 import functools
 import inspect
 import logging
-from collections.abc import Callable
+import types
+import typing
+from collections.abc import Callable, Mapping
 from typing import TYPE_CHECKING, Any
 
 from channels_rpc.exceptions import JsonRpcError, JsonRpcErrorCode
@@ -94,6 +96,23 @@ def inspect_accepts_context(func: Callable) -> bool:
 
             if annotation is RpcContext:
                 return True
+
+            # Resolve other string annotations, e.g. aliased or dotted imports.
+            # Only this parameter's annotation is evaluated, so unresolvable
+            # annotations on later parameters do not hide the context.
+            if isinstance(annotation, str):
+                target = types.SimpleNamespace(
+                    __annotations__={first_param.name: annotation}
+                )
+                try:
+                    hints = typing.get_type_hints(
+                        target,
+                        globalns=getattr(inspect.unwrap(func), "__globals__", {}),
+                        include_extras=True,
+                    )
+                except (NameError, SyntaxError):
+                    return False
+                return hints.get(first_param.name) is RpcContext
         except ImportError:
             pass
 
@@ -121,7 +140,7 @@ def inspect_accepts_context(func: Callable) -> bool:
 def create_rpc_method_wrapper(
     func: Callable,
     name: str,
-    options: dict[str, bool],
+    options: Mapping[str, bool],
     *,
     accepts_context: bool | None = None,
     timeout: float | None = None,
@@ -138,7 +157,7 @@ def create_rpc_method_wrapper(
         The function to wrap.
     name : str
         The RPC method name to register.
-    options : dict[str, bool]
+    options : Mapping[str, bool]
         Options for the method (e.g., {"websocket": True}).
     accepts_context : bool | None, optional
         Whether the function accepts RpcContext. If None, will be auto-detected
@@ -11,9 +11,32 @@ import issues between modules.
 from __future__ import annotations
 
 import functools
-from collections.abc import Callable
-from dataclasses import dataclass
-from typing import Any, Protocol
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Any, Final, Protocol
+
+# Shared read-only transport option mappings. Nearly every method uses one of
+# these, so registration hands out the same instance instead of a new dict.
+TRANSPORT_WS_ON: Final[Mapping[str, bool]] = MappingProxyType({"websocket": True})
+TRANSPORT_WS_OFF: Final[Mapping[str, bool]] = MappingProxyType({"websocket": False})
+NO_TRANSPORT_OPTIONS: Final[Mapping[str, bool]] = MappingProxyType({})
+
+
+def get_transport_options(*, websocket: bool) -> Mapping[str, bool]:
+    """Return the shared transport options mapping for a method.
+
+    Parameters
+    ----------
+    websocket : bool
+        Whether the method is available over WebSocket.
+
+    Returns
+    -------
+    Mapping[str, bool]
+        Read-only mapping shared between all methods with the same options.
+    """
+    return TRANSPORT_WS_ON if websocket else TRANSPORT_WS_OFF
 
 
 @dataclass
@@ -32,7 +55,7 @@ class MethodInfo:
         Method docstring if available.
     accepts_context : bool
         Whether method accepts RpcContext parameter.
-    transport_options : dict[str, bool]
+    transport_options : Mapping[str, bool]
         Transport availability (e.g., {"websocket": True}).
     is_notification : bool
         Whether this is a notification handler.
@@ -43,11 +66,11 @@ class MethodInfo:
     signature: str
     docstring: str | None
     accepts_context: bool
-    transport_options: dict[str, bool]
+    transport_options: Mapping[str, bool]
     is_notification: bool
 
 
-@dataclass
+@dataclass(slots=True)
 class RpcMethodWrapper:
     """Wrapper for RPC method with transport options.
 
@@ -59,7 +82,7 @@ class RpcMethodWrapper:
     ----------
     func : Callable
         The actual RPC method function.
-    options : dict[str, bool]
+    options : Mapping[str, bool]
         Transport options (websocket, http).
     name : str
         Method name to register.
@@ -72,21 +95,35 @@ class RpcMethodWrapper:
     -----
     The wrapper supports descriptor protocol for proper method binding and
     can be called directly like the wrapped function.
+
+    Instances use ``__slots__`` since one is kept per registered method.
+    ``__name__`` and ``__qualname__`` cannot be declared as slots (class
+    creation reserves those names), so they are stored privately and served
+    by :meth:`__getattr__`.
     """
 
     func: Callable[..., Any]
-    options: dict[str, bool]
+    options: Mapping[str, bool]
     name: str
     accepts_context: bool
     timeout: float | None = None
+    _func_name: str = field(default="", init=False, repr=False, compare=False)
+    _func_qualname: str = field(default="", init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
         """Initialize wrapper attributes after dataclass init."""
-        # Set __name__ and __qualname__ to mimic the wrapped function
-        object.__setattr__(self, "__name__", getattr(self.func, "__name__", self.name))
-        object.__setattr__(
-            self, "__qualname__", getattr(self.func, "__qualname__", self.name)
-        )
+        # Record __name__ and __qualname__ to mimic the wrapped function
+        self._func_name = getattr(self.func, "__name__", self.name)
+        self._func_qualname = getattr(self.func, "__qualname__", self.name)
+
+    def __getattr__(self, attr: str) -> Any:
+        """Resolve ``__name__`` and ``__qualname__`` from the wrapped function."""
+        if attr == "__name__":
+            return self._func_name
+        if attr == "__qualname__":
+            return self._func_qualname
+        msg = f"{type(self).__name__!r} object has no attribute {attr!r}"
+        raise AttributeError(msg)
 
     def __call__(self, *args: Any, **kwargs: Any) -> Any:
         """Make the wrapper callable."""
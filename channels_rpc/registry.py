@@ -2,31 +2,99 @@
 
 from __future__ import annotations
 
+import weakref
 from typing import TYPE_CHECKING
-from weakref import WeakKeyDictionary
 
 if TYPE_CHECKING:
     from channels_rpc.rpc_base import RpcMethodWrapper
 
+    _MethodTable = dict[str, RpcMethodWrapper]
+    _MethodSnapshot = tuple[tuple[str, RpcMethodWrapper], ...]
+
 
 class MethodRegistry:
     """Registry for RPC methods and notifications.
 
-    Uses WeakKeyDictionary to prevent memory leaks while maintaining
-    class-level method registration.
+    Tables are plain dicts keyed by ``id(consumer_class)``, which is cheaper
+    to look up than a WeakKeyDictionary. A :func:`weakref.finalize` callback
+    per class purges its entries when the class is garbage collected, so
+    registration does not keep classes alive and stale ids are never reused.
 
     Attributes
     ----------
-    _methods : WeakKeyDictionary
-        Mapping of consumer classes to their registered methods.
-    _notifications : WeakKeyDictionary
-        Mapping of consumer classes to their registered notifications.
+    _methods : dict[int, dict[str, RpcMethodWrapper]]
+        Mapping of consumer class ids to their registered methods.
+    _notifications : dict[int, dict[str, RpcMethodWrapper]]
+        Mapping of consumer class ids to their registered notifications.
+    _method_snapshots : dict[int, tuple]
+        Cached immutable ``(name, method)`` tuples per consumer class,
+        invalidated whenever a method is registered.
+    _notification_snapshots : dict[int, tuple]
+        Cached immutable ``(name, notification)`` tuples per consumer class,
+        invalidated whenever a notification is registered.
+    _finalizers : dict[int, weakref.finalize]
+        Cleanup callbacks of the consumer classes known to the registry.
+    _owners : weakref.WeakValueDictionary[int, type]
+        Reverse index from ``id(wrapper)`` to the class it was last
+        registered on, see :meth:`owner_of`.
     """
 
     def __init__(self) -> None:
         """Initialize the registry."""
-        self._methods: WeakKeyDictionary = WeakKeyDictionary()
-        self._notifications: WeakKeyDictionary = WeakKeyDictionary()
+        self._methods: dict[int, _MethodTable] = {}
+        self._notifications: dict[int, _MethodTable] = {}
+        self._method_snapshots: dict[int, _MethodSnapshot] = {}
+        self._notification_snapshots: dict[int, _MethodSnapshot] = {}
+        self._finalizers: dict[int, weakref.finalize] = {}
+        self._owners: weakref.WeakValueDictionary[int, type] = (
+            weakref.WeakValueDictionary()
+        )
+
+    def _track(self, consumer_class: type) -> int:
+        """Return the table key for a class, tracking its lifetime.
+
+        Parameters
+        ----------
+        consumer_class : type
+            The consumer class about to be stored in the registry.
+
+        Returns
+        -------
+        int
+            The ``id()`` of the class.
+        """
+        key = id(consumer_class)
+        if key not in self._finalizers:
+            finalizer = weakref.finalize(consumer_class, self._forget, key)
+            finalizer.atexit = False
+            self._finalizers[key] = finalizer
+        return key
+
+    def _forget(self, key: int) -> None:
+        """Drop every entry of a garbage-collected class."""
+        self._methods.pop(key, None)
+        self._notifications.pop(key, None)
+        self._method_snapshots.pop(key, None)
+        self._notification_snapshots.pop(key, None)
+        self._finalizers.pop(key, None)
+
+    def _set_owner(
+        self,
+        consumer_class: type,
+        previous: RpcMethodWrapper | None,
+        method: RpcMethodWrapper,
+    ) -> None:
+        """Point the reverse index at the class a wrapper was registered on."""
+        if previous is not None and previous is not method:
+            # The replaced wrapper may be collected and its id reused
+            self._owners.pop(id(previous), None)
+        self._owners[id(method)] = consumer_class
+
+    @staticmethod
+    def _invalidate_description(consumer_class: type) -> None:
+        """Drop the class's cached ``describe_api()`` result, if any."""
+        if consumer_class.__dict__.get("_cached_api_description") is not None:
+            consumer_class._cached_api_description = None  # type: ignore[attr-defined]
 
     def register_method(
         self,
@@ -45,9 +113,14 @@ class MethodRegistry:
         method : RpcMethodWrapper
             The wrapped method to register.
         """
-        if consumer_class not in self._methods:
-            self._methods[consumer_class] = {}
-        self._methods[consumer_class][method_name] = method
+        key = self._track(consumer_class)
+        methods = self._methods.get(key)
+        if methods is None:
+            methods = self._methods[key] = {}
+        self._set_owner(consumer_class, methods.get(method_name), method)
+        methods[method_name] = method
+        self._method_snapshots.pop(key, None)
+        self._invalidate_description(consumer_class)
 
     def register_notification(
         self,
@@ -66,9 +139,14 @@ class MethodRegistry:
         method : RpcMethodWrapper
             The wrapped method to register.
         """
-        if consumer_class not in self._notifications:
-            self._notifications[consumer_class] = {}
-        self._notifications[consumer_class][method_name] = method
+        key = self._track(consumer_class)
+        notifications = self._notifications.get(key)
+        if notifications is None:
+            notifications = self._notifications[key] = {}
+        self._set_owner(consumer_class, notifications.get(method_name), method)
+        notifications[method_name] = method
+        self._notification_snapshots.pop(key, None)
+        self._invalidate_description(consumer_class)
 
     def get_methods(self, consumer_class: type) -> dict[str, RpcMethodWrapper]:
         """Get all RPC methods for a consumer class.
@@ -83,7 +161,7 @@ class MethodRegistry:
         dict[str, RpcMethodWrapper]
             Dictionary mapping method names to methods.
         """
-        return self._methods.get(consumer_class, {})
+        return self._methods.get(id(consumer_class), {})
 
     def get_notifications(self, consumer_class: type) -> dict[str, RpcMethodWrapper]:
         """Get all RPC notifications for a consumer class.
@@ -98,7 +176,55 @@ class MethodRegistry:
         dict[str, RpcMethodWrapper]
             Dictionary mapping notification names to methods.
         """
-        return self._notifications.get(consumer_class, {})
+        return self._notifications.get(id(consumer_class), {})
+
+    def get_method_items(
+        self, consumer_class: type
+    ) -> tuple[tuple[str, RpcMethodWrapper], ...]:
+        """Get an immutable snapshot of the RPC methods for a consumer class.
+
+        The snapshot is cached until the next method registration for the
+        class, so repeated iteration does not copy the underlying dict.
+
+        Parameters
+        ----------
+        consumer_class : type
+            The consumer class.
+
+        Returns
+        -------
+        tuple[tuple[str, RpcMethodWrapper], ...]
+            ``(name, method)`` pairs in registration order.
+        """
+        snapshot = self._method_snapshots.get(id(consumer_class))
+        if snapshot is None:
+            snapshot = tuple(self.get_methods(consumer_class).items())
+            self._method_snapshots[self._track(consumer_class)] = snapshot
+        return snapshot
+
+    def get_notification_items(
+        self, consumer_class: type
+    ) -> tuple[tuple[str, RpcMethodWrapper], ...]:
+        """Get an immutable snapshot of the RPC notifications for a consumer class.
+
+        The snapshot is cached until the next notification registration for
+        the class, so repeated iteration does not copy the underlying dict.
+
+        Parameters
+        ----------
+        consumer_class : type
+            The consumer class.
+
+        Returns
+        -------
+        tuple[tuple[str, RpcMethodWrapper], ...]
+            ``(name, notification)`` pairs in registration order.
+        """
+        snapshot = self._notification_snapshots.get(id(consumer_class))
+        if snapshot is None:
+            snapshot = tuple(self.get_notifications(consumer_class).items())
+            self._notification_snapshots[self._track(consumer_class)] = snapshot
+        return snapshot
 
     def get_method(
         self, consumer_class: type, method_name: str
@@ -117,8 +243,24 @@ class MethodRegistry:
         RpcMethodWrapper | None
             The method if found, None otherwise.
         """
-        methods: dict[str, RpcMethodWrapper] = self._methods.get(consumer_class, {})
-        return methods.get(method_name)
+        return self._methods.get(id(consumer_class), {}).get(method_name)
+
+    def owner_of(self, method: RpcMethodWrapper) -> type | None:
+        """Get the consumer class a wrapper is registered on.
+
+        Parameters
+        ----------
+        method : RpcMethodWrapper
+            A wrapper previously passed to :meth:`register_method` or
+            :meth:`register_notification`.
+
+        Returns
+        -------
+        type | None
+            The class of the most recent registration of the wrapper, or None
+            if it is not registered (or its class was garbage collected).
+        """
+        return self._owners.get(id(method))
 
     def has_method(self, consumer_class: type, method_name: str) -> bool:
         """Check if a method is registered.
@@ -135,7 +277,7 @@ class MethodRegistry:
         bool
             True if method is registered.
         """
-        return method_name in self._methods.get(consumer_class, {})
+        return method_name in self._methods.get(id(consumer_class), {})
 
     def list_method_names(self, consumer_class: type) -> list[str]:
         """List all registered method names for a class.
@@ -150,7 +292,7 @@ class MethodRegistry:
         list[str]
             List of method names.
         """
-        return list(self._methods.get(consumer_class, {}).keys())
+        return list(self._methods.get(id(consumer_class), {}).keys())
 
 
 # Global registry instance
@@ -12,11 +12,13 @@ References
 
 from __future__ import annotations
 
+import copy
 import inspect
 import json
 import logging
 import time
-from collections.abc import Callable
+from collections.abc import Callable, Mapping
+from types import MappingProxyType
 from typing import TYPE_CHECKING, Any
 
 from channels_rpc import logs
@@ -28,14 +30,26 @@ from channels_rpc.exceptions import (
     generate_error_response,
 )
 from channels_rpc.limits import check_size_limits
-from channels_rpc.protocols import MethodInfo, RpcMethodWrapper
+from channels_rpc.protocols import (
+    NO_TRANSPORT_OPTIONS,
+    TRANSPORT_WS_ON,
+    MethodInfo,
+    RpcMethodWrapper,
+    get_transport_options,
+)
 from channels_rpc.registry import get_registry
 from channels_rpc.signals import (
     rpc_method_completed,
     rpc_method_failed,
     rpc_method_started,
 )
-from channels_rpc.utils import create_json_rpc_request, create_json_rpc_response
+from channels_rpc.utils import (
+    ID_KEY,
+    JSONRPC_KEY,
+    JSONRPC_VERSION,
+    RESULT_KEY,
+    create_json_rpc_request,
+)
 from channels_rpc.validation import validate_rpc_data
 
 if TYPE_CHECKING:
@@ -98,6 +112,18 @@ class RpcBase:
     # Default to None to avoid mutable default argument bug
     middleware: list[RpcMiddleware] | None = None
 
+    # describe_api() result cached per class; reset by the method registry
+    # whenever a method or notification is registered for the class
+    _cached_api_description: dict[str, Any] | None = None
+
+    # Per-class views of the registry tables, set on the class itself by
+    # rpc_method() and rpc_notification() so dispatch can skip the registry.
+    # Always read through cls.__dict__: subclasses do not inherit methods.
+    # Both are read-only live views; register through the registry so its
+    # snapshots and the cached API description stay in sync.
+    __rpc_methods__: Mapping[str, RpcMethodWrapper]
+    __rpc_notifications__: Mapping[str, RpcMethodWrapper]
+
     if TYPE_CHECKING:
         # Type hints for methods provided by Channels consumer mixin
         # These are defined in ChannelsConsumerProtocol
@@ -163,12 +189,15 @@ class RpcBase:
             wrapper = create_rpc_method_wrapper(
                 func=method,
                 name=name,
-                options={"websocket": websocket},
+                options=get_transport_options(websocket=websocket),
                 timeout=timeout,
             )
 
             registry = get_registry()
             registry.register_method(cls, name, wrapper)
+            if "__rpc_methods__" not in cls.__dict__:
+                # Live view: later registrations update the same table
+                cls.__rpc_methods__ = MappingProxyType(registry.get_methods(cls))
             return wrapper
 
         return wrap
@@ -266,11 +295,16 @@ class RpcBase:
             wrapper = create_rpc_method_wrapper(
                 func=method,
                 name=name,
-                options={"websocket": websocket},
+                options=get_transport_options(websocket=websocket),
             )
 
             registry = get_registry()
             registry.register_notification(cls, name, wrapper)
+            if "__rpc_notifications__" not in cls.__dict__:
+                # Live view: later registrations update the same table
+                cls.__rpc_notifications__ = MappingProxyType(
+                    registry.get_notifications(cls)
+                )
             return wrapper
 
         return wrap
@@ -373,20 +407,42 @@ class RpcBase:
         registry = get_registry()
 
         # Check methods first, then notifications
-        methods = registry.get_methods(cls)
         is_notification = False
-        if method_name in methods:
-            wrapper = methods[method_name]
-        else:
-            notifications = registry.get_notifications(cls)
-            if method_name in notifications:
-                wrapper = notifications[method_name]
-                is_notification = True
-            else:
+        wrapper = registry.get_methods(cls).get(method_name)
+        if wrapper is None:
+            wrapper = registry.get_notifications(cls).get(method_name)
+            if wrapper is None:
                 msg = f"Method '{method_name}' not registered"
                 raise KeyError(msg)
+            is_notification = True
+
+        return cls._build_method_info(
+            method_name, wrapper, is_notification=is_notification
+        )
+
+    @staticmethod
+    def _build_method_info(
+        method_name: str,
+        wrapper: RpcMethodWrapper | Callable,
+        *,
+        is_notification: bool,
+    ) -> MethodInfo:
+        """Extract metadata from a registered method.
+
+        Parameters
+        ----------
+        method_name : str
+            Name the method is registered under.
+        wrapper : RpcMethodWrapper | Callable
+            Registered method.
+        is_notification : bool
+            Whether the method is registered as a notification.
 
-        # Extract metadata
+        Returns
+        -------
+        MethodInfo
+            Metadata about the method.
+        """
         func = wrapper.func if isinstance(wrapper, RpcMethodWrapper) else wrapper
         sig = inspect.signature(func)
 
@@ -401,11 +457,56 @@ class RpcBase:
                 else False
             ),
             transport_options=(
-                wrapper.options if isinstance(wrapper, RpcMethodWrapper) else {}
+                wrapper.options
+                if isinstance(wrapper, RpcMethodWrapper)
+                else NO_TRANSPORT_OPTIONS
             ),
             is_notification=is_notification,
         )
 
+    @classmethod
+    def _build_api_entry(
+        cls,
+        method_name: str,
+        wrapper: RpcMethodWrapper | Callable,
+        *,
+        is_notification: bool,
+    ) -> dict[str, Any] | None:
+        """Build the :meth:`describe_api` entry for a registered method.
+
+        Parameters
+        ----------
+        method_name : str
+            Name the method is registered under.
+        wrapper : RpcMethodWrapper | Callable
+            Registered method.
+        is_notification : bool
+            Whether the method is registered as a notification.
+
+        Returns
+        -------
+        dict[str, Any] | None
+            API entry, or None if the method could not be introspected.
+        """
+        kind = "notification" if is_notification else "method"
+        try:
+            info = cls._build_method_info(
+                method_name, wrapper, is_notification=is_notification
+            )
+        except Exception as e:
+            logger.warning("Failed to introspect %s %s: %s", kind, method_name, e)
+            return None
+
+        entry: dict[str, Any] = {
+            "name": info.name,
+            "signature": info.signature,
+            "doc": info.docstring,
+            "accepts_context": info.accepts_context,
+        }
+        if not is_notification:
+            entry["transports"] = [k for k, v in info.transport_options.items() if v]
+        return entry
+
     @classmethod
     def describe_api(cls) -> dict[str, Any]:
         """Generate a JSON-serializable API description.
@@ -413,7 +514,16 @@ class RpcBase:
         Returns
         -------
         dict[str, Any]
-            API description including all methods and notifications.
+            API description including all methods and notifications. The
+            ``methods_by_name`` and ``notifications_by_name`` keys index the
+            same entries by name for constant-time lookup.
+
+        Notes
+        -----
+        The description is built once per class and cached until a method or
+        notification is registered for it, whether through the decorators or
+        directly on the registry. Each call returns a copy of the cached
+        description, so callers may modify the result freely.
 
         Examples
         --------
@@ -428,50 +538,43 @@ class RpcBase:
               "accepts_context": true
             }
           ],
-          "notifications": [...]
+          "notifications": [...],
+          "methods_by_name": {"get_user": {...}},
+          "notifications_by_name": {...}
         }
         """
+        cached = cls.__dict__.get("_cached_api_description")
+        if cached is not None:
+            return copy.deepcopy(cached)
+
+        registry = get_registry()
+        method_items = registry.get_method_items(cls)
+        notification_items = registry.get_notification_items(cls)
+
         methods_list = []
-        for method_name in cls.get_rpc_methods():
-            try:
-                info = cls.get_method_info(method_name)
-                methods_list.append(
-                    {
-                        "name": info.name,
-                        "signature": info.signature,
-                        "doc": info.docstring,
-                        "accepts_context": info.accepts_context,
-                        "transports": [
-                            k for k, v in info.transport_options.items() if v
-                        ],
-                    }
-                )
-            except Exception as e:
-                logger.warning("Failed to introspect method %s: %s", method_name, e)
+        for method_name, wrapper in method_items:
+            entry = cls._build_api_entry(method_name, wrapper, is_notification=False)
+            if entry is not None:
+                methods_list.append(entry)
 
         notifications_list = []
-        for notif_name in cls.get_rpc_notifications():
-            try:
-                info = cls.get_method_info(notif_name)
-                notifications_list.append(
-                    {
-                        "name": info.name,
-                        "signature": info.signature,
-                        "doc": info.docstring,
-                        "accepts_context": info.accepts_context,
-                    }
-                )
-            except Exception as e:
-                logger.warning(
-                    "Failed to introspect notification %s: %s", notif_name, e
-                )
+        for notif_name, wrapper in notification_items:
+            entry = cls._build_api_entry(notif_name, wrapper, is_notification=True)
+            if entry is not None:
+                notifications_list.append(entry)
 
-        return {
+        description = {
             "jsonrpc": "2.0",
             "consumer": cls.__name__,
             "methods": methods_list,
             "notifications": notifications_list,
+            "methods_by_name": {entry["name"]: entry for entry in methods_list},
+            "notifications_by_name": {
+                entry["name"]: entry for entry in notifications_list
+            },
         }
+        cls._cached_api_description = description
+        return copy.deepcopy(description)
 
     def validate_scope(self) -> None:
         """Validate and sanitize scope data.
@@ -671,29 +774,38 @@ class RpcBase:
         method_name = data["method"]
         logger.debug("Getting method: %s", method_name)
 
-        registry = get_registry()
-        methods = (
-            registry.get_notifications(self.__class__)
-            if is_notification
-            else registry.get_methods(self.__class__)
+        cls = self.__class__
+        methods = cls.__dict__.get(
+            "__rpc_notifications__" if is_notification else "__rpc_methods__"
         )
+        if methods is None:
+            registry = get_registry()
+            methods = (
+                registry.get_notifications(cls)
+                if is_notification
+                else registry.get_methods(cls)
+            )
 
-        try:
-            method = methods[method_name]
-        except KeyError as e:
+        method = methods.get(method_name)
+        if method is None:
             raise JsonRpcError(
                 rpc_id, JsonRpcErrorCode.METHOD_NOT_FOUND, data={"method": method_name}
-            ) from e
-        protocol = self.scope["type"]
+            )
         # Handle both RpcMethodWrapper and raw Callable (backward compatibility)
         if isinstance(method, RpcMethodWrapper):
             # Check if method is enabled for this protocol
-            # Default to True for unknown protocols for backward compatibility
-            if not method.options.get(protocol, True):
+            # Default to True for unknown protocols for backward compatibility.
+            # The shared "all enabled" options pass for every protocol, so the
+            # scope lookup is only needed for methods that disable one.
+            options = method.options
+            if options is not TRANSPORT_WS_ON and not options.get(
+                self.scope["type"], True
+            ):
                 raise JsonRpcError(rpc_id, JsonRpcErrorCode.METHOD_NOT_FOUND)
             logger.debug("Method found: %s", method.func.__name__)
         else:
             # Legacy raw callable with options attribute
+            protocol = self.scope["type"]
             if not getattr(method, "options", {}).get(protocol, True):
                 raise JsonRpcError(rpc_id, JsonRpcErrorCode.METHOD_NOT_FOUND)
             logger.debug("Method found: %s", method.__name__)
@@ -795,17 +907,16 @@ class RpcBase:
             is_notification=is_notification,
         )
 
-        logger.debug("Executing %s(%s)", method.__qualname__, json.dumps(params))
+        # Only pay for serializing the parameters when debug logging is on;
+        # notifications in particular never build anything else per call
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Executing %s(%s)", method.__qualname__, json.dumps(params))
         result = self._execute_called_method(method, params, context)
         if not is_notification:
             logger.debug("Execution result: %s", result)
-            # Return standard JSON-RPC 2.0 response
-            response = create_json_rpc_response(
-                rpc_id=rpc_id,
-                result=result,
-                compressed=False,
-            )
-            return response
+            # Standard JSON-RPC 2.0 response, built inline on this hot path
+            # (same envelope as create_json_rpc_response())
+            return {JSONRPC_KEY: JSONRPC_VERSION, ID_KEY: rpc_id, RESULT_KEY: result}
         elif result is not None:
             logger.warning("The notification method shouldn't return any result")
             logger.warning("method: %s, params: %s", method.__qualname__, params)
@@ -941,7 +1052,9 @@ class RpcBase:
         rpc_id: str | int | float | None,
         method_name: str,
         start_time: float,
-    ) -> dict[str, Any]:
+        *,
+        is_notification: bool = False,
+    ) -> dict[str, Any] | None:
         """Handle exceptions during RPC method execution.
 
         Parameters
@@ -954,11 +1067,14 @@ class RpcBase:
             Method name for error reporting.
         start_time : float
             Start time for duration calculation.
+        is_notification : bool, optional
+            Whether the call is a notification, by default False.
 
         Returns
         -------
-        dict[str, Any]
-            Error response.
+        dict[str, Any] | None
+            Error response, or None for notifications, which never receive
+            one.
         """
         duration = time.time() - start_time
         rpc_method_failed.send(
@@ -972,17 +1088,13 @@ class RpcBase:
 
         if isinstance(exception, JsonRpcError):
             # Re-raise JSON-RPC errors as-is
-            return exception.as_dict()
+            return None if is_notification else exception.as_dict()
         elif isinstance(exception, ValueError | TypeError | KeyError | AttributeError):
             # Expected application-level errors (domain logic errors)
             # Note: RuntimeError intentionally NOT caught here - it indicates bugs
             logger.info("Application error in RPC method: %s", exception)
-            return generate_error_response(
-                rpc_id=rpc_id,
-                code=JsonRpcErrorCode.GENERIC_APPLICATION_ERROR,
-                message="Application error occurred",
-                data=None,  # Never leak internal details
-            )
+            code = JsonRpcErrorCode.GENERIC_APPLICATION_ERROR
+            message = "Application error occurred"
         else:
             # Unexpected errors - these indicate bugs
             from channels_rpc.config import get_config  # noqa: PLC0415
@@ -1000,12 +1112,18 @@ class RpcBase:
                 # Development mode: Log with full stack trace
                 logger.exception("Unexpected error processing RPC call")
 
-            return generate_error_response(
-                rpc_id=rpc_id,
-                code=JsonRpcErrorCode.INTERNAL_ERROR,
-                message="Internal server error",
-                data=None,  # Never leak internal details
-            )
+            code = JsonRpcErrorCode.INTERNAL_ERROR
+            message = "Internal server error"
+
+        if is_notification:
+            # Nothing is sent back for notifications, so skip the envelope
+            return None
+        return generate_error_response(
+            rpc_id=rpc_id,
+            code=code,
+            message=message,
+            data=None,  # Never leak internal details
+        )
 
     def _intercept_call(self, data: dict[str, Any]) -> tuple[Any, bool]:
         """Handle JSON-RPC 2.0 requests and responses.
@@ -1133,7 +1251,9 @@ class RpcBase:
             # Handle application-level errors only
             # Note: Exception removed from tuple to avoid masking system exceptions
             # Unexpected errors will propagate and be logged by outer error handlers
-            result = self._handle_rpc_exception(e, rpc_id, method_name, start_time)
+            result = self._handle_rpc_exception(
+                e, rpc_id, method_name, start_time, is_notification=is_notification
+            )
 
         if rpc_id:
             logger.debug(logs.RPC_METHOD_CALL_END, rpc_id, method_name, result)
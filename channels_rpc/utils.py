@@ -1,8 +1,20 @@
 from __future__ import annotations
 
+import sys
 import warnings
 from typing import Any
 
+# Interned envelope keys shared by every message built in the package, so the
+# hot response paths reuse the same string objects and their cached hashes.
+JSONRPC_KEY = sys.intern("jsonrpc")
+JSONRPC_VERSION = sys.intern("2.0")
+ID_KEY = sys.intern("id")
+RESULT_KEY = sys.intern("result")
+ERROR_KEY = sys.intern("error")
+
+# Envelope every request starts from; copied, never handed out
+_REQUEST_TEMPLATE: dict[str, Any] = {JSONRPC_KEY: JSONRPC_VERSION}
+
 
 def create_json_rpc_request(
     rpc_id: str | int | None = None,
@@ -25,13 +37,11 @@ def create_json_rpc_request(
     dict[str, Any]
         JSON-RPC 2.0 request message.
     """
-    message: dict[str, Any] = {
-        "jsonrpc": "2.0",
-        "method": method,
-    }
+    message = _REQUEST_TEMPLATE.copy()
+    message["method"] = method
 
     if rpc_id is not None:
-        message["id"] = rpc_id
+        message[ID_KEY] = rpc_id
 
     if params is not None:
         message["params"] = params
@@ -65,14 +75,14 @@ def create_json_rpc_response(
         JSON-RPC 2.0 response message.
     """
     message: dict[str, Any] = {
-        "jsonrpc": "2.0",
-        "id": rpc_id,
+        JSONRPC_KEY: JSONRPC_VERSION,
+        ID_KEY: rpc_id,
     }
 
     if error is not None:
-        message["error"] = error
+        message[ERROR_KEY] = error
     else:
-        message["result"] = result
+        message[RESULT_KEY] = result
         if compressed:
             message["compressed"] = True
 
@@ -103,15 +113,12 @@ def create_json_rpc_error_response(
     dict[str, Any]
         JSON-RPC 2.0 error response message.
     """
-    error_obj = {
-        "code": code,
-        "message": message,
-    }
-
+    error_obj: dict[str, Any] = {"code": code, "message": message}
     if data is not None:
         error_obj["data"] = data
 
-    return create_json_rpc_response(rpc_id=rpc_id, error=error_obj)
+    # Same envelope as create_json_rpc_response(), built without the extra call
+    return {JSONRPC_KEY: JSONRPC_VERSION, ID_KEY: rpc_id, ERROR_KEY: error_obj}
 
 
 # Backward compatibility - deprecated
@@ -15,9 +15,25 @@ from channels_rpc.exceptions import (
     JsonRpcErrorCode,
     generate_error_response,
 )
+from channels_rpc.utils import ERROR_KEY
 
 logger = logging.getLogger("channels_rpc")
 
+# Malformed messages carry no usable id, so their error response is constant.
+# It is built once and copied per message (callers may mutate the result).
+_INVALID_REQUEST_TEMPLATE = generate_error_response(
+    rpc_id=None,
+    code=JsonRpcErrorCode.INVALID_REQUEST,
+    message=RPC_ERRORS[JsonRpcErrorCode.INVALID_REQUEST],
+)
+
+
+def _invalid_request_response() -> dict[str, Any]:
+    """Return a fresh copy of the Invalid Request error response."""
+    response = _INVALID_REQUEST_TEMPLATE.copy()
+    response[ERROR_KEY] = response[ERROR_KEY].copy()
+    return response
+
 
 def validate_rpc_data(data: Any) -> tuple[dict[str, Any] | None, bool]:
     """Validate RPC data and determine if it's a response.
@@ -47,35 +63,20 @@ def validate_rpc_data(data: Any) -> tuple[dict[str, Any] | None, bool]:
     >>> error  # None - valid request
     >>> is_response  # False - not a response
     """
-    # Check for empty data
+    # Fast path: a non-empty dict is either a request or a response
+    if isinstance(data, dict) and data:
+        if "result" in data or "error" in data:
+            logger.debug("Received JSON-RPC 2.0 response: %s", data)
+            return data, True
+        # Data is valid, proceed with processing
+        return None, False
+
+    # Anything else is rejected with the same Invalid Request error
     if not data:
         logger.warning(logs.EMPTY_CALL)
-        message = RPC_ERRORS[JsonRpcErrorCode.INVALID_REQUEST]
-        return (
-            generate_error_response(
-                rpc_id=None, code=JsonRpcErrorCode.INVALID_REQUEST, message=message
-            ),
-            False,
-        )
-
-    # Check data type
-    if not isinstance(data, dict):
+    else:
         logger.warning("Invalid message type: %s", type(data).__name__)
-        message = RPC_ERRORS[JsonRpcErrorCode.INVALID_REQUEST]
-        return (
-            generate_error_response(
-                rpc_id=None, code=JsonRpcErrorCode.INVALID_REQUEST, message=message
-            ),
-            False,
-        )
-
-    # Detect if this is a response (not a request to process)
-    if "result" in data or "error" in data:
-        logger.debug("Received JSON-RPC 2.0 response: %s", data)
-        return data, True
-
-    # Data is valid, proceed with processing
-    return None, False
+    return _invalid_request_response(), False
 
 
 def is_rpc_response(data: dict[str, Any]) -> bool:
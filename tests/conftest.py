@@ -1,4 +1,9 @@
-"""Shared test fixtures for channels-rpc test suite."""
+"""Shared test fixtures for channels-rpc test suite.
+
+The suite can run in parallel with ``pytest -n auto`` (pytest-xdist). Each
+worker is a separate process with its own method registry, so tests that
+register methods do not need to be grouped onto the same worker.
+"""
 
 from __future__ import annotations
 
@@ -162,9 +167,14 @@ def mock_async_rpc_consumer(mock_websocket_scope):
 # ============================================================================
 
 
-@pytest.fixture
-def consumer_with_methods(mock_websocket_scope):
-    """Consumer with registered test methods."""
+@pytest.fixture(scope="module")
+def consumer_with_methods_class():
+    """Consumer class with registered test methods, built once per module.
+
+    Registration is the expensive part of the consumer fixtures, so the class
+    is shared while each test still gets its own instance. Tests that register
+    extra methods should do so on a subclass to keep the shared class intact.
+    """
 
     class TestConsumer(MockRpcConsumer):
         pass
@@ -189,12 +199,18 @@ def consumer_with_methods(mock_websocket_scope):
     def notify_event(event: str) -> None:
         pass
 
-    return TestConsumer(mock_websocket_scope)
+    return TestConsumer
 
 
 @pytest.fixture
-def async_consumer_with_methods(mock_websocket_scope):
-    """Async consumer with registered test methods."""
+def consumer_with_methods(consumer_with_methods_class, mock_websocket_scope):
+    """Consumer with registered test methods."""
+    return consumer_with_methods_class(mock_websocket_scope)
+
+
+@pytest.fixture(scope="module")
+def async_consumer_with_methods_class():
+    """Async consumer class with registered test methods, built once per module."""
 
     class TestAsyncConsumer(MockAsyncRpcConsumer):
         pass
@@ -211,7 +227,15 @@ def async_consumer_with_methods(mock_websocket_scope):
     async def async_notify(event: str) -> None:
         pass
 
-    return TestAsyncConsumer(mock_websocket_scope)
+    return TestAsyncConsumer
+
+
+@pytest.fixture
+def async_consumer_with_methods(
+    async_consumer_with_methods_class, mock_websocket_scope
+):
+    """Async consumer with registered test methods."""
+    return async_consumer_with_methods_class(mock_websocket_scope)
 
 
 # ============================================================================
@@ -13,6 +13,9 @@ CRITICAL TESTS - End-to-end WebSocket RPC functionality:
 
 from __future__ import annotations
 
+import json
+from datetime import datetime, timezone
+
 import pytest
 from channels.testing import WebsocketCommunicator
 
@@ -242,8 +245,6 @@ class TestAsyncJsonRpcWebsocketConsumer:
     @pytest.mark.asyncio
     async def test_async_custom_json_encoder(self):
         """Should use custom JSON encoder when provided in async consumer."""
-        import json
-        from datetime import datetime
 
         class DateTimeEncoder(json.JSONEncoder):
             def default(self, obj):
@@ -273,6 +274,39 @@ class TestAsyncJsonRpcWebsocketConsumer:
 
         await communicator.disconnect()
 
+    @pytest.mark.asyncio
+    async def test_async_orjson_encoding_matches_stdlib(self):
+        """Should encode with orjson like the default stdlib encoder."""
+        pytest.importorskip("orjson")
+
+        class TestAsyncConsumer(AsyncJsonRpcWebsocketConsumer):
+            use_orjson = True
+
+        data = {
+            "jsonrpc": "2.0",
+            "id": 1,
+            "result": {
+                1: "one",
+                "when": datetime(2024, 12, 25, 18, 45, 30, tzinfo=timezone.utc),
+            },
+        }
+
+        encoded = await TestAsyncConsumer.encode_json(data)
+
+        assert json.loads(encoded) == json.loads(json.dumps(data, default=str))
+
+    @pytest.mark.asyncio
+    async def test_async_orjson_falls_back_to_stdlib(self):
+        """Should fall back to the stdlib encoder for values orjson rejects."""
+        pytest.importorskip("orjson")
+
+        class TestAsyncConsumer(AsyncJsonRpcWebsocketConsumer):
+            use_orjson = True
+
+        encoded = await TestAsyncConsumer.encode_json({"result": 2**70})
+
+        assert json.loads(encoded) == {"result": 2**70}
+
 
 # ============================================================================
 # Consumer Feature Tests
@@ -5,6 +5,7 @@ This test suite validates performance-critical paths including:
 - Concurrent connection handling
 - Size limit validation overhead
 - Large response chunking and compression
+- JSON-RPC message builders
 
 Tests are marked with @pytest.mark.performance and @pytest.mark.slow
 to allow selective execution in CI/CD pipelines.
@@ -26,6 +27,11 @@ from channels_rpc.context import RpcContext
 from channels_rpc.limits import check_size_limits
 from channels_rpc.registry import get_registry
 from channels_rpc.rpc_base import RpcBase, RpcMethodWrapper
+from channels_rpc.utils import (
+    create_json_rpc_error_response,
+    create_json_rpc_request,
+    create_json_rpc_response,
+)
 from tests.conftest import MockRpcConsumer
 
 # ============================================================================
@@ -37,6 +43,8 @@ METHOD_INTROSPECTION_ITERATIONS = 100_000  # 100k calls for cache test
 CACHE_PERFORMANCE_THRESHOLD_SECONDS = 0.1  # Must complete in <0.1s
 CONCURRENT_REQUESTS = 100  # Number of concurrent RPC calls
 SIZE_VALIDATION_THRESHOLD_MS = 1.0  # Validation overhead <1ms per request
+BUILDER_ITERATIONS = 100_000  # 100k messages per builder benchmark
+BUILDER_THRESHOLD_US = 100.0  # Building one message must take <100us
 
 
 # ============================================================================
@@ -750,3 +758,55 @@ class TestLargeResponseChunkingPerformance:
             f"{iterations} calls in {elapsed:.3f}s "
             f"({iterations/elapsed:.0f} calls/sec)"
         )
+
+
+# ============================================================================
+# Test 5: Message Builder Performance
+# ============================================================================
+
+
+@pytest.mark.performance
+@pytest.mark.slow
+class TestMessageBuilderPerformance:
+    """Guard the JSON-RPC message builders against performance regressions.
+
+    Every request, response and error frame goes through these builders, so
+    each one is timed in isolation: arguments are built once up front and
+    only the builder call runs inside the timed loop.
+    """
+
+    @pytest.mark.parametrize(
+        "builder,kwargs",
+        [
+            pytest.param(
+                create_json_rpc_request,
+                {"rpc_id": 1, "method": "test_method", "params": {"key": "value"}},
+                id="request",
+            ),
+            pytest.param(
+                create_json_rpc_response,
+                {"rpc_id": 1, "result": {"key": "value"}},
+                id="response",
+            ),
+            pytest.param(
+                create_json_rpc_error_response,
+                {"rpc_id": 1, "code": -32601, "message": "Method Not Found"},
+                id="error-response",
+            ),
+        ],
+    )
+    def test_builder_overhead(self, builder, kwargs):
+        """Validate that building one message stays in the microsecond range."""
+        iterations = BUILDER_ITERATIONS
+        start_time = time.perf_counter()
+
+        for _ in range(iterations):
+            builder(**kwargs)
+
+        elapsed = time.perf_counter() - start_time
+        avg_time_us = (elapsed / iterations) * 1_000_000
+
+        assert avg_time_us < BUILDER_THRESHOLD_US, (
+            f"{builder.__name__} took {avg_time_us:.3f}us per message, "
+            f"expected <{BUILDER_THRESHOLD_US}us"
+        )
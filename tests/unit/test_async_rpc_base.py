@@ -14,12 +14,15 @@ CRITICAL TESTS - Async variants of core RPC functionality:
 
 from __future__ import annotations
 
+import logging
+
 import pytest
 
 from channels_rpc.async_rpc_base import AsyncRpcBase
 from channels_rpc.context import RpcContext
 from channels_rpc.exceptions import JsonRpcErrorCode
 from channels_rpc.registry import get_registry
+from channels_rpc.utils import create_json_rpc_response
 
 
 @pytest.mark.unit
@@ -173,6 +176,26 @@ class TestAsyncProcessCall:
 
         assert result is None
 
+    @pytest.mark.asyncio
+    async def test_process_call_skips_params_dump_without_debug_logging(
+        self, async_consumer_with_methods, caplog
+    ):
+        """Should not serialize params for the debug log unless it is enabled."""
+        caplog.set_level(logging.INFO, logger="channels_rpc")
+        # Not JSON-serializable, so formatting the debug message would raise
+        data = {
+            "jsonrpc": "2.0",
+            "method": "async_notify",
+            "params": {"event": object()},
+        }
+
+        result = await async_consumer_with_methods._process_call(
+            data, is_notification=True
+        )
+
+        assert result is None
+        assert not any("Executing" in record.message for record in caplog.records)
+
     @pytest.mark.asyncio
     async def test_process_call_with_no_params(self, async_consumer_with_methods):
         """Should handle async methods with no params."""
@@ -438,6 +461,55 @@ class TestAsyncInterceptCall:
         # data field is not included when None
         assert "data" not in result["error"] or result["error"]["data"] is None
 
+    @pytest.mark.asyncio
+    async def test_intercept_call_failed_notification_builds_no_response(self):
+        """Should not build an error response for a failing notification."""
+
+        class FailingAsyncConsumer(AsyncRpcBase):
+            def __init__(self):
+                self.scope = {"type": "websocket"}
+
+        @FailingAsyncConsumer.rpc_notification()
+        async def failing_notification():
+            msg = "Error"
+            raise ValueError(msg)
+
+        consumer = FailingAsyncConsumer()
+        data = {"jsonrpc": "2.0", "method": "failing_notification"}
+
+        result, is_notification = await consumer._intercept_call(data)
+
+        assert result is None
+        assert is_notification is True
+
+    @pytest.mark.asyncio
+    async def test_intercept_call_respects_disabled_transport(self):
+        """Should reject methods disabled for the connection's scope type."""
+
+        class TransportAsyncConsumer(AsyncRpcBase):
+            def __init__(self):
+                self.scope = {"type": "websocket"}
+
+        @TransportAsyncConsumer.rpc_method()
+        async def enabled():
+            return "ok"
+
+        @TransportAsyncConsumer.rpc_method(websocket=False)
+        async def disabled():
+            return "unreachable"
+
+        consumer = TransportAsyncConsumer()
+
+        result, _ = await consumer._intercept_call(
+            {"jsonrpc": "2.0", "method": "enabled", "id": 1}
+        )
+        assert result["result"] == "ok"
+
+        result, _ = await consumer._intercept_call(
+            {"jsonrpc": "2.0", "method": "disabled", "id": 2}
+        )
+        assert result["error"]["code"] == JsonRpcErrorCode.METHOD_NOT_FOUND
+
 
 @pytest.mark.unit
 class TestAsyncBaseReceiveJson:
@@ -590,6 +662,19 @@ class TestAsyncProcessingEdgeCases:
 
         assert result["id"] is None
 
+    @pytest.mark.asyncio
+    async def test_intercept_invalid_responses_are_independent(
+        self, mock_async_rpc_consumer
+    ):
+        """Should return a separate Invalid Request response per message."""
+        first, _ = await mock_async_rpc_consumer._intercept_call([])
+        second, _ = await mock_async_rpc_consumer._intercept_call(123)
+
+        assert first == second
+        assert first["error"]["code"] == JsonRpcErrorCode.INVALID_REQUEST
+        first["error"]["data"] = "mutated"
+        assert "data" not in second["error"]
+
     @pytest.mark.asyncio
     async def test_process_call_compressed_flag_always_false(
         self, async_consumer_with_methods
@@ -608,3 +693,23 @@ class TestAsyncProcessingEdgeCases:
 
         # compressed field is only included if True
         assert "compressed" not in result
+
+    @pytest.mark.asyncio
+    async def test_process_call_matches_response_builder(
+        self, async_consumer_with_methods
+    ):
+        """Should produce the same envelope as create_json_rpc_response()."""
+        data = {
+            "jsonrpc": "2.0",
+            "method": "async_add",
+            "params": {"a": 2, "b": 2},
+            "id": "req-1",
+        }
+
+        result = await async_consumer_with_methods._process_call(
+            data, is_notification=False
+        )
+
+        expected = create_json_rpc_response(rpc_id="req-1", result=4)
+        assert result == expected
+        assert list(result) == list(expected)
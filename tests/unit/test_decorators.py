@@ -10,6 +10,7 @@ from unittest.mock import MagicMock
 
 import pytest
 
+from channels_rpc import context
 from channels_rpc.context import RpcContext
 from channels_rpc.decorators import (
     create_rpc_method_wrapper,
@@ -88,6 +89,38 @@ class TestInspectAcceptsContext:
         result = inspect_accepts_context(method_wrong_type)
         assert result is False
 
+    def test_function_with_qualified_context_annotation(self):
+        """Should resolve string annotations that name RpcContext indirectly."""
+
+        def method_with_context(ctx: context.RpcContext, value: int) -> int:
+            return value * 2
+
+        result = inspect_accepts_context(method_with_context)
+        assert result is True
+
+    def test_function_with_unresolvable_annotation(self):
+        """Should return False when string annotations cannot be resolved."""
+
+        def method_unresolvable(ctx, value: int) -> int:
+            return value * 2
+
+        # Set at runtime so that static checkers do not resolve the name
+        method_unresolvable.__annotations__["ctx"] = "UndefinedType"
+
+        result = inspect_accepts_context(method_unresolvable)
+        assert result is False
+
+    def test_function_with_unresolvable_later_annotation(self):
+        """Should detect the context when only later annotations fail to resolve."""
+
+        def method_with_context(ctx: context.RpcContext, value: int) -> int:
+            return value * 2
+
+        method_with_context.__annotations__["value"] = "UndefinedType"
+
+        result = inspect_accepts_context(method_with_context)
+        assert result is True
+
 
 @pytest.mark.unit
 class TestCreateRpcMethodWrapper:
@@ -149,6 +182,21 @@ class TestCreateRpcMethodWrapper:
         # __name__ should match original function
         assert wrapper.__name__ == "my_function"
 
+    def test_wrapper_is_slotted(self):
+        """Should store wrapper state in slots while mimicking the function."""
+
+        def my_function(value: int) -> int:
+            return value
+
+        wrapper = create_rpc_method_wrapper(
+            func=my_function, name="registered_name", options={}
+        )
+
+        assert not hasattr(wrapper, "__dict__")
+        assert wrapper.__qualname__ == my_function.__qualname__
+        with pytest.raises(AttributeError):
+            wrapper.missing_attribute  # noqa: B018
+
 
 @pytest.mark.unit
 class TestPermissionRequired:
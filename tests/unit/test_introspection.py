@@ -67,6 +67,17 @@ class TestGetMethodInfo:
 
         assert info.transport_options["websocket"] is False
 
+    def test_transport_options_shared_between_methods(self, consumer_with_methods):
+        """Should reuse one read-only options mapping per transport setting."""
+        cls = consumer_with_methods.__class__
+        enabled = cls.get_method_info("websocket_only").transport_options
+        disabled = cls.get_method_info("no_websocket").transport_options
+
+        assert cls.get_method_info("add").transport_options is enabled
+        assert enabled is not disabled
+        with pytest.raises(TypeError):
+            enabled["websocket"] = False
+
     def test_get_method_info_includes_docstring(self, mock_websocket_scope):
         """Should extract docstring from method."""
         from channels_rpc.rpc_base import RpcBase
@@ -191,8 +202,7 @@ class TestDescribeApi:
         """Should include all required fields for each method."""
         api_desc = consumer_with_methods.__class__.describe_api()
 
-        # Find the 'add' method
-        add_method = next(m for m in api_desc["methods"] if m["name"] == "add")
+        add_method = api_desc["methods_by_name"]["add"]
 
         assert "name" in add_method
         assert "signature" in add_method
@@ -204,10 +214,7 @@ class TestDescribeApi:
         """Should include required fields for each notification."""
         api_desc = consumer_with_methods.__class__.describe_api()
 
-        # Find the notification
-        notify = next(
-            n for n in api_desc["notifications"] if n["name"] == "notify_event"
-        )
+        notify = api_desc["notifications_by_name"]["notify_event"]
 
         assert "name" in notify
         assert "signature" in notify
@@ -218,7 +225,7 @@ class TestDescribeApi:
         """Should include method signatures in description."""
         api_desc = consumer_with_methods.__class__.describe_api()
 
-        add_method = next(m for m in api_desc["methods"] if m["name"] == "add")
+        add_method = api_desc["methods_by_name"]["add"]
         # Signature includes type information
         assert "a:" in add_method["signature"]
         assert "b:" in add_method["signature"]
@@ -228,8 +235,8 @@ class TestDescribeApi:
         """Should correctly flag methods that accept context."""
         api_desc = consumer_with_methods.__class__.describe_api()
 
-        add_method = next(m for m in api_desc["methods"] if m["name"] == "add")
-        echo_method = next(m for m in api_desc["methods"] if m["name"] == "echo")
+        add_method = api_desc["methods_by_name"]["add"]
+        echo_method = api_desc["methods_by_name"]["echo"]
 
         assert add_method["accepts_context"] is False
         assert echo_method["accepts_context"] is True
@@ -238,12 +245,8 @@ class TestDescribeApi:
         """Should list available transports for each method."""
         api_desc = consumer_with_methods.__class__.describe_api()
 
-        ws_method = next(
-            m for m in api_desc["methods"] if m["name"] == "websocket_only"
-        )
-        no_ws_method = next(
-            m for m in api_desc["methods"] if m["name"] == "no_websocket"
-        )
+        ws_method = api_desc["methods_by_name"]["websocket_only"]
+        no_ws_method = api_desc["methods_by_name"]["no_websocket"]
 
         # websocket_only should list websocket as available
         assert "websocket" in ws_method["transports"]
@@ -254,10 +257,24 @@ class TestDescribeApi:
         """Should handle methods without docstrings gracefully."""
         api_desc = consumer_with_methods.__class__.describe_api()
 
-        add_method = next(m for m in api_desc["methods"] if m["name"] == "add")
+        add_method = api_desc["methods_by_name"]["add"]
         # add() has no docstring, should be None
         assert add_method["doc"] is None
 
+    def test_describe_api_indexes_entries_by_name(self, consumer_with_methods):
+        """Should index the listed entries by name."""
+        api_desc = consumer_with_methods.__class__.describe_api()
+
+        assert list(api_desc["methods_by_name"]) == [
+            m["name"] for m in api_desc["methods"]
+        ]
+        for method in api_desc["methods"]:
+            assert api_desc["methods_by_name"][method["name"]] is method
+        for notification in api_desc["notifications"]:
+            assert (
+                api_desc["notifications_by_name"][notification["name"]] is notification
+            )
+
     def test_describe_api_with_empty_consumer(self, mock_websocket_scope):
         """Should handle consumer with no registered methods."""
         from channels_rpc.rpc_base import RpcBase
@@ -297,6 +314,113 @@ class TestDescribeApi:
         parsed = json.loads(json_str)
         assert parsed["jsonrpc"] == "2.0"
 
+    def test_describe_api_wrapper_registered_under_several_names(
+        self, consumer_with_methods
+    ):
+        """Should describe a shared wrapper by the name and kind it has per class."""
+        from channels_rpc.decorators import create_rpc_method_wrapper
+        from channels_rpc.protocols import get_transport_options
+        from channels_rpc.registry import get_registry
+
+        class FirstConsumer(type(consumer_with_methods)):  # type: ignore[misc]
+            pass
+
+        class SecondConsumer(type(consumer_with_methods)):  # type: ignore[misc]
+            pass
+
+        def f() -> None:
+            pass
+
+        wrapper = create_rpc_method_wrapper(
+            f, "f", get_transport_options(websocket=True)
+        )
+        registry = get_registry()
+        registry.register_method(FirstConsumer, "f", wrapper)
+        assert FirstConsumer.describe_api()["methods_by_name"]["f"]["name"] == "f"
+
+        registry.register_method(SecondConsumer, "alias", wrapper)
+        registry.register_notification(SecondConsumer, "notif", wrapper)
+        api_desc = SecondConsumer.describe_api()
+
+        assert api_desc["methods_by_name"]["alias"]["name"] == "alias"
+        assert "f" not in api_desc["methods_by_name"]
+        notification = api_desc["notifications_by_name"]["notif"]
+        assert notification["name"] == "notif"
+        assert "transports" not in notification
+
+    def test_describe_api_cached_until_registration(self, consumer_with_methods):
+        """Should reuse the description until a new method is registered."""
+
+        # Register on a dedicated class so the shared fixture class stays intact
+        class LateConsumer(type(consumer_with_methods)):  # type: ignore[misc]
+            pass
+
+        api_desc = LateConsumer.describe_api()
+        cached = LateConsumer.__dict__["_cached_api_description"]
+
+        assert LateConsumer.describe_api() == api_desc
+        assert LateConsumer.__dict__["_cached_api_description"] is cached
+
+        @LateConsumer.rpc_method()
+        def late_method() -> None:
+            pass
+
+        updated = LateConsumer.describe_api()
+        assert LateConsumer.__dict__["_cached_api_description"] is not cached
+        assert "late_method" in {m["name"] for m in updated["methods"]}
+
+    def test_describe_api_returns_independent_copies(self, consumer_with_methods):
+        """Should not let changes to one result leak into later calls."""
+        cls = consumer_with_methods.__class__
+        api_desc = cls.describe_api()
+        expected = cls.describe_api()
+
+        api_desc["methods"].append("junk")
+        api_desc["methods"][0]["name"] = "renamed"
+        api_desc["methods_by_name"].clear()
+
+        assert cls.describe_api() == expected
+
+    def test_describe_api_cache_reset_by_registry_registration(
+        self, consumer_with_methods
+    ):
+        """Should pick up methods registered directly on the registry."""
+        from channels_rpc.decorators import create_rpc_method_wrapper
+        from channels_rpc.protocols import get_transport_options
+        from channels_rpc.registry import get_registry
+
+        class DirectConsumer(type(consumer_with_methods)):  # type: ignore[misc]
+            pass
+
+        def direct_method() -> None:
+            pass
+
+        def direct_notification() -> None:
+            pass
+
+        assert DirectConsumer.describe_api()["methods"] == []
+
+        options = get_transport_options(websocket=True)
+        registry = get_registry()
+        registry.register_method(
+            DirectConsumer,
+            "direct_method",
+            create_rpc_method_wrapper(direct_method, "direct_method", options),
+        )
+        assert "direct_method" in DirectConsumer.describe_api()["methods_by_name"]
+
+        registry.register_notification(
+            DirectConsumer,
+            "direct_notification",
+            create_rpc_method_wrapper(
+                direct_notification, "direct_notification", options
+            ),
+        )
+        assert (
+            "direct_notification"
+            in DirectConsumer.describe_api()["notifications_by_name"]
+        )
+
     def test_describe_api_introspection_failures_logged(
         self, mock_websocket_scope, caplog
     ):
@@ -322,7 +446,9 @@ class TestDescribeApi:
         # Manually register a broken method (without proper wrapper)
         registry = get_registry()
         # Register a non-callable to trigger error
-        registry._methods[BrokenConsumer] = {"broken_method": None}
+        registry.register_method(
+            BrokenConsumer, "broken_method", None  # type: ignore[arg-type]
+        )
 
         api_desc = BrokenConsumer.describe_api()
 
@@ -3,6 +3,8 @@
 import gc
 import weakref
 
+import pytest
+
 from channels_rpc.context import RpcContext
 from channels_rpc.registry import MethodRegistry, get_registry
 from channels_rpc.rpc_base import RpcBase, RpcMethodWrapper
@@ -187,9 +189,35 @@ class TestMethodRegistry:
         # Force garbage collection
         gc.collect()
 
-        # WeakKeyDictionary should have cleaned up
+        # Registration must not keep the class alive
         assert weak_ref() is None
 
+    def test_entries_purged_on_collection(self):
+        """Should drop all entries of a class once it is garbage collected."""
+        registry = MethodRegistry()
+
+        class TestClass:
+            pass
+
+        wrapper = RpcMethodWrapper(
+            func=lambda: None,
+            options={"websocket": True},
+            name="test",
+            accepts_context=False,
+        )
+
+        registry.register_method(TestClass, "test", wrapper)
+        registry.register_notification(TestClass, "test", wrapper)
+        registry.get_method_items(TestClass)
+
+        del TestClass
+        gc.collect()
+
+        assert registry._methods == {}
+        assert registry._notifications == {}
+        assert registry._method_snapshots == {}
+        assert registry._finalizers == {}
+
     def test_multiple_classes(self):
         """Should handle multiple classes independently."""
         registry = MethodRegistry()
@@ -247,6 +275,84 @@ class TestMethodRegistry:
         retrieved = registry.get_method(TestClass, "test")
         assert retrieved == wrapper2
 
+    def test_method_items_snapshot_cached(self):
+        """Should reuse the snapshot until a new method is registered."""
+        registry = MethodRegistry()
+
+        class TestClass:
+            pass
+
+        wrapper1 = RpcMethodWrapper(
+            func=lambda: None,
+            options={"websocket": True},
+            name="method1",
+            accepts_context=False,
+        )
+        wrapper2 = RpcMethodWrapper(
+            func=lambda: None,
+            options={"websocket": True},
+            name="method2",
+            accepts_context=False,
+        )
+
+        registry.register_method(TestClass, "method1", wrapper1)
+        snapshot = registry.get_method_items(TestClass)
+        assert snapshot == (("method1", wrapper1),)
+        assert registry.get_method_items(TestClass) is snapshot
+
+        registry.register_method(TestClass, "method2", wrapper2)
+        assert registry.get_method_items(TestClass) == (
+            ("method1", wrapper1),
+            ("method2", wrapper2),
+        )
+
+    def test_notification_items_snapshot_invalidated(self):
+        """Should rebuild the notification snapshot after registration."""
+        registry = MethodRegistry()
+
+        class TestClass:
+            pass
+
+        wrapper = RpcMethodWrapper(
+            func=lambda: None,
+            options={"websocket": True},
+            name="notify",
+            accepts_context=False,
+        )
+
+        assert registry.get_notification_items(TestClass) == ()
+        registry.register_notification(TestClass, "notify", wrapper)
+        assert registry.get_notification_items(TestClass) == (("notify", wrapper),)
+
+    def test_owner_of(self):
+        """Should map a registered wrapper back to its class."""
+        registry = MethodRegistry()
+
+        class TestClass:
+            pass
+
+        wrapper1 = RpcMethodWrapper(
+            func=lambda: 1,
+            options={"websocket": True},
+            name="test",
+            accepts_context=False,
+        )
+        wrapper2 = RpcMethodWrapper(
+            func=lambda: 2,
+            options={"websocket": True},
+            name="test",
+            accepts_context=False,
+        )
+
+        assert registry.owner_of(wrapper1) is None
+        registry.register_method(TestClass, "test", wrapper1)
+        assert registry.owner_of(wrapper1) is TestClass
+
+        # Replacing a wrapper drops the replaced one from the index
+        registry.register_method(TestClass, "test", wrapper2)
+        assert registry.owner_of(wrapper1) is None
+        assert registry.owner_of(wrapper2) is TestClass
+
     def test_methods_and_notifications_separate(self):
         """Should keep methods and notifications in separate registries."""
         registry = MethodRegistry()
@@ -421,3 +527,46 @@ class TestRegistryIntegration:
         assert wrapper.name == "test"
         assert wrapper.options["websocket"] is True
         assert wrapper.accepts_context is True  # Has RpcContext parameter
+
+    def test_decorator_binds_method_table_to_class(self):
+        """Should expose the registry's method table on the class itself."""
+
+        class ParentConsumer(RpcBase):
+            pass
+
+        class ChildConsumer(ParentConsumer):
+            pass
+
+        @ParentConsumer.rpc_method()
+        def parent_method():
+            pass
+
+        @ParentConsumer.rpc_notification()
+        def parent_notification():
+            pass
+
+        registry = get_registry()
+        methods = ParentConsumer.__dict__["__rpc_methods__"]
+        assert methods == registry.get_methods(ParentConsumer)
+        with pytest.raises(TypeError):
+            methods["other"] = None
+        notifications = ParentConsumer.__dict__["__rpc_notifications__"]
+        assert notifications == registry.get_notifications(ParentConsumer)
+        with pytest.raises(TypeError):
+            notifications["other"] = None
+
+        # The read-only views reflect later registrations
+        @ParentConsumer.rpc_method()
+        def late_method():
+            pass
+
+        @ParentConsumer.rpc_notification()
+        def late_notification():
+            pass
+
+        assert "late_method" in methods
+        assert ParentConsumer.__dict__["__rpc_methods__"] is methods
+        assert "late_notification" in notifications
+        assert ParentConsumer.__dict__["__rpc_notifications__"] is notifications
+        # Subclasses keep their own tables and do not inherit the parent's
+        assert "__rpc_methods__" not in ChildConsumer.__dict__
@@ -10,33 +10,18 @@ import asyncio
 
 import pytest
 
-from channels_rpc.async_rpc_base import MAX_METHOD_EXECUTION_TIME, AsyncRpcBase
+from channels_rpc.async_rpc_base import MAX_METHOD_EXECUTION_TIME
 from channels_rpc.context import RpcContext
-from channels_rpc.exceptions import JsonRpcErrorCode
+from channels_rpc.exceptions import JsonRpcError, JsonRpcErrorCode
 from channels_rpc.registry import get_registry
+from tests.conftest import MockAsyncRpcConsumer
 
 
-@pytest.fixture
-def async_consumer_with_timeout_methods(mock_websocket_scope):
-    """Async consumer with methods having various timeout configurations."""
-
-    class MockAsyncConsumer(AsyncRpcBase):
-        def __init__(self, scope=None):
-            self.scope = scope or {"type": "websocket"}
-            self.sent_messages = []
-
-        async def send_json(self, data):  # type: ignore[override]
-            self.sent_messages.append(data)
-
-        async def send(self, data):  # type: ignore[override]
-            self.sent_messages.append(data)
-
-        def encode_json(self, data):
-            import json
+@pytest.fixture(scope="module")
+def timeout_consumer_class():
+    """Async consumer class with methods having various timeout configurations."""
 
-            return json.dumps(data)
-
-    class TestConsumer(MockAsyncConsumer):
+    class TestConsumer(MockAsyncRpcConsumer):
         pass
 
     @TestConsumer.rpc_method()
@@ -57,6 +42,12 @@ def async_consumer_with_timeout_methods(mock_websocket_scope):
         await asyncio.sleep(0.5)  # Too slow
         return "should_not_reach_here"
 
+    @TestConsumer.rpc_method(timeout=0.01)
+    async def stalled_method() -> str:
+        """Method that never completes, so its timeout always fires."""
+        await asyncio.Event().wait()
+        return "should_not_reach_here"
+
     @TestConsumer.rpc_method(timeout=0)
     async def no_timeout_method() -> str:
         """Method with timeout disabled (timeout=0)."""
@@ -69,7 +60,45 @@ def async_consumer_with_timeout_methods(mock_websocket_scope):
         await asyncio.sleep(0.2)
         return "success"
 
-    return TestConsumer(mock_websocket_scope)
+    return TestConsumer
+
+
+@pytest.fixture(scope="module")
+def timeout_method_wrappers(timeout_consumer_class):
+    """Registered wrappers of the timeout test methods, keyed by name."""
+    return dict(get_registry().get_methods(timeout_consumer_class))
+
+
+@pytest.fixture
+def async_consumer_with_timeout_methods(timeout_consumer_class):
+    """Async consumer with methods having various timeout configurations."""
+    return timeout_consumer_class({"type": "websocket"})
+
+
+@pytest.fixture
+def immediate_timeout(monkeypatch):
+    """Make ``asyncio.wait_for`` time out at once instead of after a real wait."""
+
+    async def wait_for(aw, **_kwargs):
+        aw.close()
+        raise asyncio.TimeoutError
+
+    monkeypatch.setattr("channels_rpc.async_rpc_base.asyncio.wait_for", wait_for)
+
+
+@pytest.fixture
+def no_sleep(monkeypatch):
+    """Make ``asyncio.sleep`` yield once instead of waiting.
+
+    The test methods only sleep to simulate work, so success-path tests do not
+    need to spend real time on it.
+    """
+    real_sleep = asyncio.sleep
+
+    async def sleep(_delay, result=None):
+        return await real_sleep(0, result)
+
+    monkeypatch.setattr(asyncio, "sleep", sleep)
 
 
 @pytest.mark.unit
@@ -77,21 +106,34 @@ class TestTimeoutEnforcement:
     """Test RPC method timeout enforcement."""
 
     @pytest.mark.asyncio
-    async def test_default_timeout_applied(self, async_consumer_with_timeout_methods):
-        """Should apply default timeout (300s) when none specified."""
-        registry = get_registry()
-        method = registry.get_method(
-            async_consumer_with_timeout_methods.__class__, "default_timeout_method"
-        )
-        assert method is not None
-
-        # Verify wrapper has None for timeout (will use default)
-        assert method.timeout is None
+    @pytest.mark.usefixtures("no_sleep")
+    @pytest.mark.parametrize(
+        ("method_name", "expected_timeout"),
+        [
+            ("default_timeout_method", None),
+            ("custom_timeout_method", 1.0),
+            ("no_timeout_method", 0),
+            ("negative_timeout_method", -1),
+        ],
+    )
+    async def test_timeout_metadata_and_execution(
+        self,
+        async_consumer_with_timeout_methods,
+        timeout_method_wrappers,
+        method_name,
+        expected_timeout,
+    ):
+        """Should store the configured timeout and run methods that finish in time.
 
-        # Execute method successfully (completes in 0.1s, well under 300s)
+        A timeout of None falls back to the default (300s), while zero or a
+        negative value disables enforcement entirely.
+        """
+        method = timeout_method_wrappers[method_name]
+        assert method is not None
+        assert method.timeout == expected_timeout
         request = {
             "jsonrpc": "2.0",
-            "method": "default_timeout_method",
+            "method": method_name,
             "params": {},
             "id": 1,
         }
@@ -103,32 +145,25 @@ class TestTimeoutEnforcement:
         assert response["id"] == 1
 
     @pytest.mark.asyncio
-    async def test_custom_timeout_applied(self, async_consumer_with_timeout_methods):
-        """Should apply custom timeout when specified in decorator."""
-        registry = get_registry()
-        method = registry.get_method(
-            async_consumer_with_timeout_methods.__class__, "custom_timeout_method"
-        )
-        assert method is not None
-
-        # Verify wrapper has custom timeout
-        assert method.timeout == 1.0
-
-        # Execute method successfully (completes in 0.1s, under 1s)
+    async def test_timeout_enforced_on_stalled_method(
+        self, async_consumer_with_timeout_methods
+    ):
+        """Should cancel a method that runs past its timeout."""
         request = {
             "jsonrpc": "2.0",
-            "method": "custom_timeout_method",
+            "method": "stalled_method",
             "params": {},
-            "id": 2,
+            "id": 3,
         }
 
-        response = await async_consumer_with_timeout_methods._process_call(request)
+        with pytest.raises(JsonRpcError) as exc_info:
+            await async_consumer_with_timeout_methods._process_call(request)
 
-        assert response is not None
-        assert response["result"] == "success"
-        assert response["id"] == 2
+        assert exc_info.value.code == JsonRpcErrorCode.INTERNAL_ERROR
+        assert exc_info.value.data == {"timeout": 0.01}
 
     @pytest.mark.asyncio
+    @pytest.mark.usefixtures("immediate_timeout")
     async def test_timeout_exceeded_raises_error(
         self, async_consumer_with_timeout_methods
     ):
@@ -140,10 +175,8 @@ class TestTimeoutEnforcement:
             "id": 3,
         }
 
-        # Method sleeps for 0.5s but timeout is 0.1s
+        # Timeout of 0.1s fires immediately (see immediate_timeout)
         # Should raise JsonRpcError with INTERNAL_ERROR code
-        from channels_rpc.exceptions import JsonRpcError
-
         with pytest.raises(JsonRpcError) as exc_info:
             await async_consumer_with_timeout_methods._process_call(request)
 
@@ -159,62 +192,7 @@ class TestTimeoutEnforcement:
         assert "0.1" in error_dict["error"]["message"]
 
     @pytest.mark.asyncio
-    async def test_timeout_zero_disables_enforcement(
-        self, async_consumer_with_timeout_methods
-    ):
-        """Should disable timeout enforcement when timeout=0."""
-        registry = get_registry()
-        method = registry.get_method(
-            async_consumer_with_timeout_methods.__class__, "no_timeout_method"
-        )
-        assert method is not None
-
-        # Verify wrapper has timeout=0
-        assert method.timeout == 0
-
-        # Execute method successfully (no timeout enforced)
-        request = {
-            "jsonrpc": "2.0",
-            "method": "no_timeout_method",
-            "params": {},
-            "id": 4,
-        }
-
-        response = await async_consumer_with_timeout_methods._process_call(request)
-
-        assert response is not None
-        assert response["result"] == "success"
-        assert response["id"] == 4
-
-    @pytest.mark.asyncio
-    async def test_negative_timeout_disables_enforcement(
-        self, async_consumer_with_timeout_methods
-    ):
-        """Should disable timeout enforcement when timeout is negative."""
-        registry = get_registry()
-        method = registry.get_method(
-            async_consumer_with_timeout_methods.__class__, "negative_timeout_method"
-        )
-        assert method is not None
-
-        # Verify wrapper has negative timeout
-        assert method.timeout == -1
-
-        # Execute method successfully (no timeout enforced)
-        request = {
-            "jsonrpc": "2.0",
-            "method": "negative_timeout_method",
-            "params": {},
-            "id": 5,
-        }
-
-        response = await async_consumer_with_timeout_methods._process_call(request)
-
-        assert response is not None
-        assert response["result"] == "success"
-        assert response["id"] == 5
-
-    @pytest.mark.asyncio
+    @pytest.mark.usefixtures("immediate_timeout")
     async def test_timeout_error_includes_rpc_id(
         self, async_consumer_with_timeout_methods
     ):
@@ -226,8 +204,6 @@ class TestTimeoutEnforcement:
             "id": "test-request-123",
         }
 
-        from channels_rpc.exceptions import JsonRpcError
-
         with pytest.raises(JsonRpcError) as exc_info:
             await async_consumer_with_timeout_methods._process_call(request)
 
@@ -235,6 +211,7 @@ class TestTimeoutEnforcement:
         assert error.rpc_id == "test-request-123"
 
     @pytest.mark.asyncio
+    @pytest.mark.usefixtures("immediate_timeout")
     async def test_timeout_error_includes_timeout_data(
         self, async_consumer_with_timeout_methods
     ):
@@ -246,8 +223,6 @@ class TestTimeoutEnforcement:
             "id": 8,
         }
 
-        from channels_rpc.exceptions import JsonRpcError
-
         with pytest.raises(JsonRpcError) as exc_info:
             await async_consumer_with_timeout_methods._process_call(request)
 
@@ -268,58 +243,15 @@ class TestTimeoutConfiguration:
         assert isinstance(MAX_METHOD_EXECUTION_TIME, int)
 
     @pytest.mark.asyncio
-    async def test_timeout_metadata_stored_in_wrapper(
-        self, async_consumer_with_timeout_methods
-    ):
-        """Should store timeout value in RpcMethodWrapper."""
-        registry = get_registry()
-
-        # Check default (None)
-        method = registry.get_method(
-            async_consumer_with_timeout_methods.__class__, "default_timeout_method"
-        )
-        assert method is not None
-        assert method.timeout is None
-
-        # Check custom timeout
-        method = registry.get_method(
-            async_consumer_with_timeout_methods.__class__, "custom_timeout_method"
-        )
-        assert method is not None
-        assert method.timeout == 1.0
-
-        # Check disabled timeout
-        method = registry.get_method(
-            async_consumer_with_timeout_methods.__class__, "no_timeout_method"
-        )
-        assert method is not None
-        assert method.timeout == 0
-
-    @pytest.mark.asyncio
-    async def test_timeout_with_context_injection(
-        self, async_consumer_with_timeout_methods
-    ):
+    async def test_timeout_with_context_injection(self):
         """Should enforce timeout on methods that accept RpcContext."""
 
-        class TestConsumer(AsyncRpcBase):
-            def __init__(self, scope=None):
-                self.scope = scope or {"type": "websocket"}
-                self.sent_messages = []
-
-            async def send_json(self, data):  # type: ignore[override]
-                self.sent_messages.append(data)
-
-            async def send(self, data):  # type: ignore[override]
-                self.sent_messages.append(data)
-
-            def encode_json(self, data):
-                import json
-
-                return json.dumps(data)
+        class TestConsumer(MockAsyncRpcConsumer):
+            pass
 
         @TestConsumer.rpc_method(timeout=0.2)
         async def method_with_context(ctx: RpcContext, value: str) -> str:
-            await asyncio.sleep(0.1)
+            await asyncio.sleep(0)  # Yield once, well within the timeout
             return f"Consumer: {ctx.consumer is not None}, Value: {value}"
 
         consumer = TestConsumer()
@@ -6,8 +6,6 @@ Target: 25-30 tests, 95%+ coverage of utils.py
 
 from __future__ import annotations
 
-import warnings
-
 import pytest
 
 from channels_rpc.utils import (
@@ -22,183 +20,215 @@ from channels_rpc.utils import (
 class TestCreateJsonRpcRequest:
     """Test create_json_rpc_request() function."""
 
-    def test_create_request_with_all_params(self):
-        """Should create request with rpc_id, method, and params."""
-        result = create_json_rpc_request(
-            rpc_id=1, method="test_method", params={"key": "value"}
-        )
-
-        assert result["jsonrpc"] == "2.0"
-        assert result["id"] == 1
-        assert result["method"] == "test_method"
-        assert result["params"] == {"key": "value"}
-
-    def test_create_request_with_dict_params(self):
-        """Should create request with dict parameters."""
-        params = {"arg1": "value1", "arg2": 123}
-        result = create_json_rpc_request(rpc_id=2, method="test", params=params)
-
-        assert result["params"] == params
-
-    def test_create_request_with_list_params(self):
-        """Should create request with list parameters."""
-        params = [1, 2, 3, "test"]
-        result = create_json_rpc_request(rpc_id=3, method="test", params=params)
-
-        assert result["params"] == params
-
-    def test_create_request_without_params(self):
-        """Should create request without params field when None."""
-        result = create_json_rpc_request(rpc_id=4, method="test")
-
-        assert "params" not in result
-        assert result["method"] == "test"
-
-    def test_create_notification_without_id(self):
-        """Should create notification (no id field) when rpc_id is None."""
-        result = create_json_rpc_request(method="notify", params={"event": "test"})
-
-        assert "id" not in result
-        assert result["method"] == "notify"
-
-    def test_create_request_with_string_rpc_id(self):
-        """Should accept string rpc_id."""
-        result = create_json_rpc_request(rpc_id="abc123", method="test")
-
-        assert result["id"] == "abc123"
-
-    def test_create_request_with_none_method(self):
-        """Should accept None method (though not spec-compliant)."""
-        result = create_json_rpc_request(rpc_id=1, method=None)
+    @pytest.mark.parametrize(
+        "kwargs,expected",
+        [
+            pytest.param(
+                {"rpc_id": 1, "method": "test_method", "params": {"key": "value"}},
+                {
+                    "jsonrpc": "2.0",
+                    "method": "test_method",
+                    "id": 1,
+                    "params": {"key": "value"},
+                },
+                id="all-params",
+            ),
+            pytest.param(
+                {
+                    "rpc_id": 2,
+                    "method": "test",
+                    "params": {"arg1": "value1", "arg2": 123},
+                },
+                {
+                    "jsonrpc": "2.0",
+                    "method": "test",
+                    "id": 2,
+                    "params": {"arg1": "value1", "arg2": 123},
+                },
+                id="dict-params",
+            ),
+            pytest.param(
+                {"rpc_id": 3, "method": "test", "params": [1, 2, 3, "test"]},
+                {
+                    "jsonrpc": "2.0",
+                    "method": "test",
+                    "id": 3,
+                    "params": [1, 2, 3, "test"],
+                },
+                id="list-params",
+            ),
+            pytest.param(
+                {"rpc_id": 4, "method": "test"},
+                {"jsonrpc": "2.0", "method": "test", "id": 4},
+                id="no-params",
+            ),
+            pytest.param(
+                {"method": "notify", "params": {"event": "test"}},
+                {"jsonrpc": "2.0", "method": "notify", "params": {"event": "test"}},
+                id="notification-without-id",
+            ),
+            pytest.param(
+                {"rpc_id": "abc123", "method": "test"},
+                {"jsonrpc": "2.0", "method": "test", "id": "abc123"},
+                id="string-id",
+            ),
+            pytest.param(
+                # Accepted though not spec-compliant
+                {"rpc_id": 1, "method": None},
+                {"jsonrpc": "2.0", "method": None, "id": 1},
+                id="none-method",
+            ),
+        ],
+    )
+    def test_create_request(self, kwargs, expected):
+        """Should build the request, omitting id and params when None."""
+        assert create_json_rpc_request(**kwargs) == expected
 
-        assert result["method"] is None
+    def test_requests_are_independent(self):
+        """Should return a new message each call, unaffected by earlier ones."""
+        first = create_json_rpc_request(rpc_id=1, method="first", params=[1])
+        first["extra"] = True
 
-    def test_request_always_has_jsonrpc_2_0(self):
-        """Should always include jsonrpc: '2.0' field."""
-        result = create_json_rpc_request(rpc_id=1, method="test")
+        second = create_json_rpc_request(method="second")
 
-        assert result["jsonrpc"] == "2.0"
+        assert second is not first
+        assert second == {"jsonrpc": "2.0", "method": "second"}
+        assert list(first) == ["jsonrpc", "method", "id", "params", "extra"]
 
 
 @pytest.mark.unit
 class TestCreateJsonRpcResponse:
     """Test create_json_rpc_response() function."""
 
-    def test_create_success_response(self):
-        """Should create success response with result."""
-        result = create_json_rpc_response(rpc_id=1, result={"data": "test"})
-
-        assert result["jsonrpc"] == "2.0"
-        assert result["id"] == 1
-        assert result["result"] == {"data": "test"}
-        assert "error" not in result
-
-    def test_create_error_response(self):
-        """Should create error response with error object."""
-        error = {"code": -32600, "message": "Invalid Request"}
-        result = create_json_rpc_response(rpc_id=2, error=error)
-
-        assert result["jsonrpc"] == "2.0"
-        assert result["id"] == 2
-        assert result["error"] == error
-        assert "result" not in result
-
-    def test_create_response_with_none_result(self):
-        """Should include result field even when None."""
-        result = create_json_rpc_response(rpc_id=3, result=None)
-
-        assert result["result"] is None
-        assert "result" in result
-
-    def test_create_response_with_compressed_flag(self):
-        """Should include compressed field when True."""
-        result = create_json_rpc_response(rpc_id=4, result="data", compressed=True)
-
-        assert result["compressed"] is True
-
-    def test_create_response_without_compressed_flag(self):
-        """Should not include compressed field when False."""
-        result = create_json_rpc_response(rpc_id=5, result="data", compressed=False)
-
-        assert "compressed" not in result
-
-    def test_create_response_with_string_rpc_id(self):
-        """Should accept string rpc_id."""
-        result = create_json_rpc_response(rpc_id="xyz", result="success")
-
-        assert result["id"] == "xyz"
-
-    def test_create_response_with_none_rpc_id(self):
-        """Should accept None rpc_id."""
-        result = create_json_rpc_response(rpc_id=None, result="data")
-
-        assert result["id"] is None
-
-    def test_error_response_no_compressed_flag(self):
-        """Should not include compressed field for error responses."""
-        error = {"code": -32000, "message": "Error"}
-        result = create_json_rpc_response(
-            rpc_id=6, error=error, compressed=True  # compressed ignored for errors
-        )
-
-        assert "compressed" not in result
-        assert "error" in result
-
-    def test_response_always_has_jsonrpc_2_0(self):
-        """Should always include jsonrpc: '2.0' field."""
-        result = create_json_rpc_response(rpc_id=7, result="test")
-
-        assert result["jsonrpc"] == "2.0"
+    @pytest.mark.parametrize(
+        "kwargs,expected",
+        [
+            pytest.param(
+                {"rpc_id": 1, "result": {"data": "test"}},
+                {"jsonrpc": "2.0", "id": 1, "result": {"data": "test"}},
+                id="success",
+            ),
+            pytest.param(
+                {"rpc_id": 2, "error": {"code": -32600, "message": "Invalid Request"}},
+                {
+                    "jsonrpc": "2.0",
+                    "id": 2,
+                    "error": {"code": -32600, "message": "Invalid Request"},
+                },
+                id="error",
+            ),
+            pytest.param(
+                {"rpc_id": 3, "result": None},
+                {"jsonrpc": "2.0", "id": 3, "result": None},
+                id="none-result-kept",
+            ),
+            pytest.param(
+                {"rpc_id": 4, "result": "data", "compressed": True},
+                {"jsonrpc": "2.0", "id": 4, "result": "data", "compressed": True},
+                id="compressed",
+            ),
+            pytest.param(
+                {"rpc_id": 5, "result": "data", "compressed": False},
+                {"jsonrpc": "2.0", "id": 5, "result": "data"},
+                id="not-compressed",
+            ),
+            pytest.param(
+                {"rpc_id": "xyz", "result": "success"},
+                {"jsonrpc": "2.0", "id": "xyz", "result": "success"},
+                id="string-id",
+            ),
+            pytest.param(
+                {"rpc_id": None, "result": "data"},
+                {"jsonrpc": "2.0", "id": None, "result": "data"},
+                id="none-id",
+            ),
+            pytest.param(
+                # compressed is ignored for errors
+                {
+                    "rpc_id": 6,
+                    "error": {"code": -32000, "message": "Error"},
+                    "compressed": True,
+                },
+                {
+                    "jsonrpc": "2.0",
+                    "id": 6,
+                    "error": {"code": -32000, "message": "Error"},
+                },
+                id="error-ignores-compressed",
+            ),
+        ],
+    )
+    def test_create_response(self, kwargs, expected):
+        """Should build either a result or an error response, never both."""
+        assert create_json_rpc_response(**kwargs) == expected
 
 
 @pytest.mark.unit
 class TestCreateJsonRpcErrorResponse:
     """Test create_json_rpc_error_response() function."""
 
-    def test_create_error_response_with_all_params(self):
-        """Should create error response with all parameters."""
-        result = create_json_rpc_error_response(
-            rpc_id=1, code=-32600, message="Invalid Request", data={"field": "method"}
-        )
-
-        assert result["jsonrpc"] == "2.0"
-        assert result["id"] == 1
-        assert result["error"]["code"] == -32600
-        assert result["error"]["message"] == "Invalid Request"
-        assert result["error"]["data"] == {"field": "method"}
-
-    def test_create_error_response_without_data(self):
-        """Should create error response without data field when None."""
-        result = create_json_rpc_error_response(
-            rpc_id=2, code=-32601, message="Method not found"
-        )
-
-        assert result["error"]["code"] == -32601
-        assert result["error"]["message"] == "Method not found"
-        assert "data" not in result["error"]
-
-    def test_create_error_response_default_values(self):
-        """Should use default error code and message."""
-        result = create_json_rpc_error_response(rpc_id=3)
-
-        assert result["error"]["code"] == -32603
-        assert result["error"]["message"] == "Internal error"
-
-    def test_create_error_response_with_string_rpc_id(self):
-        """Should accept string rpc_id."""
-        result = create_json_rpc_error_response(
-            rpc_id="test", code=-32600, message="Error"
-        )
-
-        assert result["id"] == "test"
-
-    def test_create_error_response_with_none_rpc_id(self):
-        """Should accept None rpc_id."""
-        result = create_json_rpc_error_response(
-            rpc_id=None, code=-32700, message="Parse error"
-        )
-
-        assert result["id"] is None
+    @pytest.mark.parametrize(
+        "kwargs,expected",
+        [
+            pytest.param(
+                {
+                    "rpc_id": 1,
+                    "code": -32600,
+                    "message": "Invalid Request",
+                    "data": {"field": "method"},
+                },
+                {
+                    "jsonrpc": "2.0",
+                    "id": 1,
+                    "error": {
+                        "code": -32600,
+                        "message": "Invalid Request",
+                        "data": {"field": "method"},
+                    },
+                },
+                id="all-params",
+            ),
+            pytest.param(
+                {"rpc_id": 2, "code": -32601, "message": "Method not found"},
+                {
+                    "jsonrpc": "2.0",
+                    "id": 2,
+                    "error": {"code": -32601, "message": "Method not found"},
+                },
+                id="without-data",
+            ),
+            pytest.param(
+                {"rpc_id": 3},
+                {
+                    "jsonrpc": "2.0",
+                    "id": 3,
+                    "error": {"code": -32603, "message": "Internal error"},
+                },
+                id="defaults",
+            ),
+            pytest.param(
+                {"rpc_id": "test", "code": -32600, "message": "Error"},
+                {
+                    "jsonrpc": "2.0",
+                    "id": "test",
+                    "error": {"code": -32600, "message": "Error"},
+                },
+                id="string-id",
+            ),
+            pytest.param(
+                {"rpc_id": None, "code": -32700, "message": "Parse error"},
+                {
+                    "jsonrpc": "2.0",
+                    "id": None,
+                    "error": {"code": -32700, "message": "Parse error"},
+                },
+                id="none-id",
+            ),
+        ],
+    )
+    def test_create_error_response(self, kwargs, expected):
+        """Should build the error response, omitting data when None."""
+        assert create_json_rpc_error_response(**kwargs) == expected
 
     @pytest.mark.parametrize(
         "code,message",
@@ -218,21 +248,28 @@ class TestCreateJsonRpcErrorResponse:
         assert result["error"]["code"] == code
         assert result["error"]["message"] == message
 
-    def test_error_response_structure(self):
-        """Should have correct JSON-RPC 2.0 error response structure."""
-        result = create_json_rpc_error_response(rpc_id=4, code=-32000, message="Test")
+    def test_error_response_matches_response_builder(self):
+        """Should produce the same envelope as create_json_rpc_response()."""
+        result = create_json_rpc_error_response(
+            rpc_id=5, code=-32602, message="Invalid Params", data={"x": 1}
+        )
+        expected = create_json_rpc_response(
+            rpc_id=5,
+            error={"code": -32602, "message": "Invalid Params", "data": {"x": 1}},
+        )
 
-        assert "jsonrpc" in result
-        assert "id" in result
-        assert "error" in result
-        assert "code" in result["error"]
-        assert "message" in result["error"]
-        assert "result" not in result
+        assert result == expected
+        assert list(result) == list(expected)
 
 
 @pytest.mark.unit
+@pytest.mark.filterwarnings("ignore::DeprecationWarning")
 class TestCreateJsonRpcFrameDeprecated:
-    """Test deprecated create_json_rpc_frame() function."""
+    """Test deprecated create_json_rpc_frame() function.
+
+    The class-level filter silences the deprecation warning for the behavior
+    tests; ``pytest.warns`` still records it in ``test_deprecated_warning``.
+    """
 
     def test_deprecated_warning(self):
         """Should emit DeprecationWarning when called."""
@@ -243,74 +280,66 @@ class TestCreateJsonRpcFrameDeprecated:
 
     def test_create_request_via_frame(self):
         """Should create request when result is None."""
-        with warnings.catch_warnings():
-            warnings.simplefilter("ignore", DeprecationWarning)
-            result = create_json_rpc_frame(
-                rpc_id=1, method="test_method", params={"key": "value"}
-            )
+        result = create_json_rpc_frame(
+            rpc_id=1, method="test_method", params={"key": "value"}
+        )
 
-        assert result["jsonrpc"] == "2.0"
-        assert result["method"] == "test_method"
-        assert result["params"] == {"key": "value"}
+        assert result == {
+            "jsonrpc": "2.0",
+            "method": "test_method",
+            "id": 1,
+            "params": {"key": "value"},
+        }
 
     def test_create_success_response_via_frame(self):
         """Should create success response when result provided."""
-        with warnings.catch_warnings():
-            warnings.simplefilter("ignore", DeprecationWarning)
-            result = create_json_rpc_frame(rpc_id=2, result={"data": "test"})
+        result = create_json_rpc_frame(rpc_id=2, result={"data": "test"})
 
-        assert result["jsonrpc"] == "2.0"
-        assert result["result"] == {"data": "test"}
+        assert result == {"jsonrpc": "2.0", "id": 2, "result": {"data": "test"}}
 
     def test_create_error_response_via_frame(self):
         """Should create error response when error provided."""
-        with warnings.catch_warnings():
-            warnings.simplefilter("ignore", DeprecationWarning)
-            error: dict[str, int | str] = {"code": -32600, "message": "Invalid"}
-            result = create_json_rpc_frame(rpc_id=3, result="ignored", error=error)
+        error: dict[str, int | str] = {"code": -32600, "message": "Invalid"}
+        result = create_json_rpc_frame(rpc_id=3, result="ignored", error=error)
 
-        assert result["jsonrpc"] == "2.0"
-        assert "error" in result
-        assert result["error"]["code"] == -32600
+        assert result == {
+            "jsonrpc": "2.0",
+            "id": 3,
+            "error": {"code": -32600, "message": "Invalid"},
+        }
 
     def test_frame_with_compressed_flag(self):
         """Should pass compressed flag to response."""
-        with warnings.catch_warnings():
-            warnings.simplefilter("ignore", DeprecationWarning)
-            result = create_json_rpc_frame(rpc_id=4, result="data", compressed=True)
+        result = create_json_rpc_frame(rpc_id=4, result="data", compressed=True)
 
-        assert result.get("compressed") is True
+        assert result == {
+            "jsonrpc": "2.0",
+            "id": 4,
+            "result": "data",
+            "compressed": True,
+        }
 
     def test_frame_ignores_rpc_id_key_parameter(self):
         """Should ignore rpc_id_key parameter (legacy)."""
-        with warnings.catch_warnings():
-            warnings.simplefilter("ignore", DeprecationWarning)
-            # rpc_id_key was used in old format, should be ignored now
-            result = create_json_rpc_frame(
-                rpc_id=5, result="test", rpc_id_key="call_id"
-            )
+        # rpc_id_key was used in old format, should be ignored now
+        result = create_json_rpc_frame(rpc_id=5, result="test", rpc_id_key="call_id")
 
         # Should use 'id' not 'call_id'
-        assert "id" in result
-        assert result["id"] == 5
-        assert "call_id" not in result
+        assert result == {"jsonrpc": "2.0", "id": 5, "result": "test"}
 
     def test_frame_error_with_missing_fields(self):
         """Should handle error dict with missing fields gracefully."""
-        with warnings.catch_warnings():
-            warnings.simplefilter("ignore", DeprecationWarning)
-            # Error dict missing message
-            error: dict[str, int | str] = {"code": -32000}
-            result = create_json_rpc_frame(rpc_id=6, result="test", error=error)
+        # Error dict missing message
+        error: dict[str, int | str] = {"code": -32000}
+        result = create_json_rpc_frame(rpc_id=6, result="test", error=error)
 
-        assert result["error"]["code"] == -32000
-        assert result["error"]["message"] == "Internal error"  # default
+        # Message falls back to the default
+        assert result["error"] == {"code": -32000, "message": "Internal error"}
 
     def test_frame_error_without_code(self):
         """Should use default error code when not provided."""
-        with warnings.catch_warnings():
-            warnings.simplefilter("ignore", DeprecationWarning)
-            error: dict[str, int | str] = {"message": "Custom error"}
-            result = create_json_rpc_frame(rpc_id=7, result="test", error=error)
+        error: dict[str, int | str] = {"message": "Custom error"}
+        result = create_json_rpc_frame(rpc_id=7, result="test", error=error)
 
-        assert result["error"]["code"] == -32603  # default INTERNAL_ERROR
+        # Code falls back to INTERNAL_ERROR
+        assert result["error"] == {"code": -32603, "message": "Custom error"}